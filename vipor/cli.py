@@ -1,22 +1,8 @@
 import argparse
 from pathlib import Path
 
+from vipor.poker.hot_roll import HotRollConfig
 from vipor.poker.paytable import PayTable
-from vipor.poker.sim import simulate
-from vipor.poker.strategy import hold_any_pair_else_none, hold_nothing
-
-try:
-    from vipor.poker.strategy_rules_riff import riff_strategy
-except Exception:
-    riff_strategy = None
-
-# Capture the actual import error for mc_best so we can show it
-_mc_best_import_error = None
-try:
-    from vipor.poker.best_hold_mc import make_mc_best_strategy
-except Exception as e:
-    make_mc_best_strategy = None
-    _mc_best_import_error = e
 
 
 def main() -> None:
@@ -39,6 +25,17 @@ def main() -> None:
 
     )
     ap.add_argument("--mc_trials", type=int, default=200)
+    ap.add_argument(
+        "--mc_workers",
+        type=int,
+        default=1,
+        help="mc_best worker processes for the pure-Python backend (0 = one per core)",
+    )
+    ap.add_argument(
+        "--mc_prune",
+        action="store_true",
+        help="mc_best: only simulate plausible holds instead of all 32 masks",
+    )
 
     ap.add_argument(
         "--ruleset",
@@ -67,13 +64,16 @@ def main() -> None:
         help="Given a Hot Roll occurs this hand, chance it triggers on deal (else draw)",
     )
 
-    from vipor.poker.frozen import parse_hand, frozen_ev_mc
     args = ap.parse_args()
+    # Imports below are deferred to the branch that needs them: a plain
+    # any_pair/job run never loads the MC, riff or frozen modules, and
+    # numpy/numba only come in when simulate() dispatches to its batched /
+    # compiled backends.
     if args.frozen_hand:
+        from vipor.poker.frozen import parse_hand
         frozen_hand = parse_hand(args.frozen_hand)
     else:
         frozen_hand = []
-    
 
     pt = PayTable.from_yaml(args.paytable)
 
@@ -87,8 +87,8 @@ def main() -> None:
 
     # frozen mode
     if args.frozen:
+        from vipor.poker.frozen import frozen_ev_mc, parse_hand
 
-        hands = parse_hand(args.frozen)
         hand = parse_hand(args.frozen)
         res = frozen_ev_mc(
             paytable=pt,
@@ -141,22 +141,27 @@ def main() -> None:
             print(f"  {k:24s} {v:9,d}  {100.0*v/res.trials:6.3f}%")
         return
 
-    hot_roll_cfg = None
-    if args.hot_roll:
-        from vipor.poker.hot_roll import HotRollConfig
-        hot_roll_cfg = HotRollConfig(
+    hot_roll_cfg = (
+        HotRollConfig(
             p_per_hand=args.hot_roll_rate,
             p_deal_given_roll=args.hot_roll_deal_share,
         )
+        if args.hot_roll
+        else None
+    )
 
     # strategy
     if args.strategy == "any_pair":
+        from vipor.poker.strategy import hold_any_pair_else_none
         strategy_fn = hold_any_pair_else_none
     elif args.strategy == "none":
+        from vipor.poker.strategy import hold_nothing
         strategy_fn = hold_nothing
     elif args.strategy == "riff":
-        if riff_strategy is None:
-            raise SystemExit("riff strategy not available")
+        try:
+            from vipor.poker.strategy_rules_riff import riff_strategy
+        except Exception as e:
+            raise SystemExit(f"riff strategy not available (import failed: {e})")
         strategy_fn = riff_strategy
     elif args.strategy == "j_riff_deuces_wild_bonus":
         # Import lazily to avoid any import-time coupling
@@ -165,31 +170,44 @@ def main() -> None:
 
 
     else:
-        if make_mc_best_strategy is None:
-            raise SystemExit(f"mc_best not available (import failed: {_mc_best_import_error})")
+        # Heavy (numpy, optional numba); only imported when actually used
+        try:
+            from vipor.poker.best_hold_mc import make_mc_best_strategy
+        except Exception as e:
+            raise SystemExit(f"mc_best not available (import failed: {e})")
         strategy_fn = make_mc_best_strategy(
             pt,
             evaluator=evaluator,
             trials=args.mc_trials,
             seed=args.seed,
-            hot_roll_cfg=hot_roll_cfg if args.hot_roll else None,
+            hot_roll_cfg=hot_roll_cfg,
             hot_roll_paytable_bet=5,
+            workers=args.mc_workers,
+            prune=args.mc_prune,
         )
 
-    res = simulate(
-        pt,
-        hands=args.hands,
-        bet_per_hand=args.bet,
-        seed=args.seed,
-        trace_n=args.trace,
-        strategy_fn=strategy_fn,
-        evaluator=evaluator,
-        frozen_hand=frozen_hand,
-        hot_roll_enabled=args.hot_roll,
-        hot_roll_cfg=hot_roll_cfg,
-        hot_roll_bet_cost=10,
-        hot_roll_paytable_bet=5,
-    )
+    from vipor.poker.sim import simulate
+
+    try:
+        res = simulate(
+            pt,
+            hands=args.hands,
+            bet_per_hand=args.bet,
+            seed=args.seed,
+            trace_n=args.trace,
+            strategy_fn=strategy_fn,
+            evaluator=evaluator,
+            frozen_hand=frozen_hand,
+            hot_roll_enabled=args.hot_roll,
+            hot_roll_cfg=hot_roll_cfg,
+            hot_roll_bet_cost=10,
+            hot_roll_paytable_bet=5,
+        )
+    finally:
+        # mc_best strategies own a worker pool
+        close = getattr(strategy_fn, "close", None)
+        if close is not None:
+            close()
 
     if args.hot_roll:
         print(f"Hot Roll: enabled  rate={args.hot_roll_rate}  deal_share={args.hot_roll_deal_share}")
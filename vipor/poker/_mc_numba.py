@@ -0,0 +1,157 @@
+"""
+Numba-compiled MC kernels for the JoB evaluator (optional; needs numba).
+
+Everything is typed-int arithmetic on packed cards (see cards.py) so the
+whole trial loop runs without touching Python objects. Importing this
+module raises ImportError when numba is missing; callers fall back to the
+NumPy path.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+from .hand_eval import (
+    CODE_FLUSH,
+    CODE_FOUR,
+    CODE_FOUR_234,
+    CODE_FOUR_ACES,
+    CODE_FOUR_ACES_234,
+    CODE_FOUR_LOW_ACE,
+    CODE_FULL_HOUSE,
+    CODE_JOB,
+    CODE_NOTHING,
+    CODE_ROYAL_FLUSH,
+    CODE_STRAIGHT,
+    CODE_STRAIGHT_FLUSH,
+    CODE_THREE,
+    CODE_TWO_PAIR,
+)
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+@njit(cache=True)
+def _splitmix64(x):
+    """Scramble a seed into a well-mixed, non-zero xorshift state."""
+    x = (x + np.uint64(0x9E3779B97F4A7C15)) & np.uint64(_MASK64)
+    x = ((x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)) & np.uint64(_MASK64)
+    x = ((x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)) & np.uint64(_MASK64)
+    x = x ^ (x >> np.uint64(31))
+    if x == np.uint64(0):
+        x = np.uint64(1)
+    return x
+
+
+@njit(cache=True)
+def _xorshift64(state):
+    state ^= state << np.uint64(13)
+    state ^= state >> np.uint64(7)
+    state ^= state << np.uint64(17)
+    return state
+
+
+@njit(cache=True)
+def _eval5_int(c0, c1, c2, c3, c4):
+    """Numba twin of hand_eval._evaluate_five_int (returns a category code)."""
+    a = (c0 >> 2) + 2
+    b = (c1 >> 2) + 2
+    c = (c2 >> 2) + 2
+    d = (c3 >> 2) + 2
+    e = (c4 >> 2) + 2
+    if a > b: a, b = b, a
+    if d > e: d, e = e, d
+    if c > e: c, e = e, c
+    if c > d: c, d = d, c
+    if a > d: a, d = d, a
+    if a > c: a, c = c, a
+    if b > e: b, e = e, b
+    if b > d: b, d = d, b
+    if b > c: b, c = c, b
+
+    e01 = a == b
+    e12 = b == c
+    e23 = c == d
+    e34 = d == e
+    pair_count = int(e01) + int(e12) + int(e23) + int(e34)
+
+    if pair_count == 0:
+        straight = (e - a == 4) or (d == 5 and e == 14)
+        s0 = c0 & 3
+        if s0 == (c1 & 3) and s0 == (c2 & 3) and s0 == (c3 & 3) and s0 == (c4 & 3):
+            if straight:
+                return CODE_ROYAL_FLUSH if a == 10 else CODE_STRAIGHT_FLUSH
+            return CODE_FLUSH
+        return CODE_STRAIGHT if straight else CODE_NOTHING
+
+    if pair_count == 3:
+        if e12 and e23:
+            if e01:
+                quad_rank, kicker_rank = a, e
+            else:
+                quad_rank, kicker_rank = e, a
+            if quad_rank == 14:
+                return CODE_FOUR_ACES_234 if kicker_rank <= 4 else CODE_FOUR_ACES
+            if quad_rank <= 4:
+                if kicker_rank <= 4 or kicker_rank == 14:
+                    return CODE_FOUR_LOW_ACE
+                return CODE_FOUR_234
+            return CODE_FOUR
+        return CODE_FULL_HOUSE
+
+    if pair_count == 2:
+        if (e01 and e12) or (e12 and e23) or (e23 and e34):
+            return CODE_THREE
+        return CODE_TWO_PAIR
+
+    pair_rank = b if (e01 or e12) else d
+    return CODE_JOB if pair_rank >= 11 else CODE_NOTHING
+
+
+@njit(cache=True)
+def _mc_ev_mask(init_arr, mask, trials, remaining_arr, paytable_arr, seed):
+    """
+    Average per-coin payout of holding `mask` over `trials` random draws.
+
+    Draws are a partial Fisher-Yates over a private copy of the deck, driven
+    by an inline xorshift64 seeded from `seed`.
+    """
+    if trials <= 0:
+        return 0.0
+
+    final = init_arr.astype(np.int64)
+    deck = remaining_arr.astype(np.int64)
+    n = deck.shape[0]
+
+    draw_pos = np.empty(5, dtype=np.int64)
+    draw_n = 0
+    for i in range(5):
+        if not (mask & (1 << i)):
+            draw_pos[draw_n] = i
+            draw_n += 1
+
+    if draw_n == 0:
+        return float(paytable_arr[_eval5_int(final[0], final[1], final[2], final[3], final[4])])
+
+    state = _splitmix64(np.uint64(seed))
+    total_unit = 0
+    for _ in range(trials):
+        for j in range(draw_n):
+            state = _xorshift64(state)
+            r = j + int(state % np.uint64(n - j))
+            tmp = deck[j]
+            deck[j] = deck[r]
+            deck[r] = tmp
+            final[draw_pos[j]] = deck[j]
+        total_unit += paytable_arr[_eval5_int(final[0], final[1], final[2], final[3], final[4])]
+
+    return total_unit / trials
+
+
+@njit(cache=True, parallel=True)
+def _mc_ev_all_masks(init_arr, trials, remaining_arr, paytable_arr, hand_seed):
+    """_mc_ev_mask for all 32 hold masks, spread across cores (prange)."""
+    out = np.empty(32, dtype=np.float64)
+    for mask in prange(32):
+        out[mask] = _mc_ev_mask(init_arr, mask, trials, remaining_arr, paytable_arr, (hand_seed << 5) | mask)
+    return out
@@ -0,0 +1,254 @@
+"""
+Numba-compiled simulate() kernel (optional; needs numba).
+
+Cards are packed ints (see cards.py); the deuces evaluators work on the
+64-bit suit-lane bitboard of the hand. The deck is an int64[52] permutation
+advanced by a partial Fisher-Yates (5 deal + one per drawn card), so there
+is no per-hand reset. Only strategies and evaluators listed below have a
+kernel twin; simulate() falls back to the Python loop for everything else.
+Importing this module raises ImportError when numba is missing.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+from . import hand_eval_deuces as _dw
+from . import hand_eval_deuces_bonus as _dwb
+from ._mc_numba import _eval5_int, _splitmix64, _xorshift64
+from .strategy import STRATEGY_NAME_TO_ID
+
+# Strategy ids (shared with strategy.STRATEGY_FN_TABLE)
+HOLD_NOTHING = STRATEGY_NAME_TO_ID["none"]
+HOLD_ALL = STRATEGY_NAME_TO_ID["all"]
+HOLD_ANY_PAIR = STRATEGY_NAME_TO_ID["any_pair"]
+HOLD_JOB_PAIR = STRATEGY_NAME_TO_ID["job_pair"]
+
+# Evaluator ids (codes index hand_eval / hand_eval_deuces / _bonus CATEGORY_NAMES)
+EVAL_JOB = 0
+EVAL_DEUCES = 1
+EVAL_DEUCES_BONUS = 2
+
+_DEUCE_MASK = 0x0001_0001_0001_0001
+_ACE_MASK = 0x1000_1000_1000_1000
+_RANK_LANE = 0x1FFF
+_ROYAL_MASK = 0x1F00
+_STRAIGHT_MASKS = np.array(_dw.STRAIGHT_MASKS, dtype=np.int64)
+
+DW_NOTHING = _dw.CODE_NOTHING
+DW_THREE = _dw.CODE_THREE_OF_A_KIND
+DW_STRAIGHT = _dw.CODE_STRAIGHT
+DW_FLUSH = _dw.CODE_FLUSH
+DW_FULL_HOUSE = _dw.CODE_FULL_HOUSE
+DW_FOUR = _dw.CODE_FOUR_OF_A_KIND
+DW_STRAIGHT_FLUSH = _dw.CODE_STRAIGHT_FLUSH
+DW_FIVE = _dw.CODE_FIVE_OF_A_KIND
+DW_WILD_ROYAL = _dw.CODE_WILD_ROYAL_FLUSH
+DW_FOUR_DEUCES = _dw.CODE_FOUR_DEUCES
+DW_NATURAL_ROYAL = _dw.CODE_NATURAL_ROYAL_FLUSH
+
+DWB_NOTHING = _dwb.CODE_NOTHING
+DWB_THREE = _dwb.CODE_THREE_OF_A_KIND
+DWB_STRAIGHT = _dwb.CODE_STRAIGHT
+DWB_FLUSH = _dwb.CODE_FLUSH
+DWB_FULL_HOUSE = _dwb.CODE_FULL_HOUSE
+DWB_FOUR = _dwb.CODE_FOUR_OF_A_KIND
+DWB_STRAIGHT_FLUSH = _dwb.CODE_STRAIGHT_FLUSH
+DWB_FIVE_6_TO_K = _dwb.CODE_FIVE_6_TO_K
+DWB_FIVE_345 = _dwb.CODE_FIVE_345
+DWB_FIVE_ACES = _dwb.CODE_FIVE_ACES
+DWB_WILD_ROYAL = _dwb.CODE_WILD_ROYAL_FLUSH
+DWB_FOUR_DEUCES = _dwb.CODE_FOUR_DEUCES
+DWB_FOUR_DEUCES_ACE = _dwb.CODE_FOUR_DEUCES_WITH_ACE
+DWB_NATURAL_ROYAL = _dwb.CODE_NATURAL_ROYAL_FLUSH
+
+
+@njit(cache=True)
+def _popcount(x):
+    n = 0
+    while x:
+        x &= x - 1
+        n += 1
+    return n
+
+
+@njit(cache=True)
+def _hand_bits(hand):
+    h = 0
+    for i in range(5):
+        c = hand[i]
+        h |= 1 << ((c & 3) * 16 + (c >> 2))
+    return h
+
+
+@njit(cache=True)
+def _deuces_features(h):
+    """
+    (wilds, naturals bitboard, ranks_any, same_suit, straight, a, b, a_rank)
+    where a >= b are the two largest natural rank counts and a_rank is the
+    rank index (rank - 2) holding a.
+    """
+    wild = h & _DEUCE_MASK
+    wilds = _popcount(wild)
+    nat = h ^ wild
+    l0 = nat & _RANK_LANE
+    l1 = (nat >> 16) & _RANK_LANE
+    l2 = (nat >> 32) & _RANK_LANE
+    l3 = (nat >> 48) & _RANK_LANE
+    ranks_any = l0 | l1 | l2 | l3
+    same_suit = (int(l0 != 0) + int(l1 != 0) + int(l2 != 0) + int(l3 != 0)) <= 1
+
+    a = 0
+    b = 0
+    a_rank = -1
+    for r in range(1, 13):  # rank index 0 is the deuce
+        cnt = ((l0 >> r) & 1) + ((l1 >> r) & 1) + ((l2 >> r) & 1) + ((l3 >> r) & 1)
+        if cnt > a:
+            b = a
+            a = cnt
+            a_rank = r
+        elif cnt > b:
+            b = cnt
+
+    straight = False
+    if _popcount(ranks_any) + wilds == 5:
+        for i in range(_STRAIGHT_MASKS.shape[0]):
+            if _popcount(_STRAIGHT_MASKS[i] & ~ranks_any) <= wilds:
+                straight = True
+                break
+    return wilds, nat, ranks_any, same_suit, straight, a, b, a_rank
+
+
+@njit(cache=True)
+def _eval_deuces_code(h):
+    """Numba twin of hand_eval_deuces.evaluate_deuces on a hand bitboard."""
+    wilds, nat, ranks_any, same_suit, straight, a, b, a_rank = _deuces_features(h)
+    if wilds == 0 and same_suit and ranks_any == _ROYAL_MASK:
+        return DW_NATURAL_ROYAL
+    if wilds == 4:
+        return DW_FOUR_DEUCES
+    if wilds > 0 and same_suit and _popcount(_ROYAL_MASK & ~ranks_any) <= wilds:
+        return DW_WILD_ROYAL
+    if wilds > 0 and a + wilds >= 5:
+        return DW_FIVE
+    if same_suit and straight:
+        return DW_STRAIGHT_FLUSH
+    if a + wilds >= 4:
+        return DW_FOUR
+    if max(0, 3 - a) + max(0, 2 - b) <= wilds:
+        return DW_FULL_HOUSE
+    if same_suit:
+        return DW_FLUSH
+    if straight:
+        return DW_STRAIGHT
+    if a + wilds >= 3:
+        return DW_THREE
+    return DW_NOTHING
+
+
+@njit(cache=True)
+def _eval_deuces_bonus_code(h):
+    """Numba twin of hand_eval_deuces_bonus.evaluate_deuces_bonus on a hand bitboard."""
+    wilds, nat, ranks_any, same_suit, straight, a, b, a_rank = _deuces_features(h)
+    if wilds == 0 and same_suit and ranks_any == _ROYAL_MASK:
+        return DWB_NATURAL_ROYAL
+    if wilds == 4:
+        return DWB_FOUR_DEUCES_ACE if nat & _ACE_MASK else DWB_FOUR_DEUCES
+    if wilds > 0 and same_suit and _popcount(_ROYAL_MASK & ~ranks_any) <= wilds:
+        return DWB_WILD_ROYAL
+    if wilds > 0 and a + wilds >= 5:
+        # With 1-3 wilds the five-of-a-kind rank is the unique one holding a
+        if a_rank == 12:
+            return DWB_FIVE_ACES
+        if a_rank <= 3:
+            return DWB_FIVE_345
+        return DWB_FIVE_6_TO_K
+    if same_suit and straight:
+        return DWB_STRAIGHT_FLUSH
+    if a + wilds >= 4:
+        return DWB_FOUR
+    if max(0, 3 - a) + max(0, 2 - b) <= wilds:
+        return DWB_FULL_HOUSE
+    if same_suit:
+        return DWB_FLUSH
+    if straight:
+        return DWB_STRAIGHT
+    if a + wilds >= 3:
+        return DWB_THREE
+    return DWB_NOTHING
+
+
+@njit(cache=True)
+def _eval_code(hand, evaluator_id):
+    if evaluator_id == EVAL_JOB:
+        return _eval5_int(hand[0], hand[1], hand[2], hand[3], hand[4])
+    if evaluator_id == EVAL_DEUCES:
+        return _eval_deuces_code(_hand_bits(hand))
+    return _eval_deuces_bonus_code(_hand_bits(hand))
+
+
+@njit(cache=True)
+def _hold_mask(hand, strategy_id, rank_counts):
+    """
+    Numba twins of the simple strategy.py holds (by strategy id).
+    `rank_counts` is an int64[13] scratch histogram, zeroed on return.
+    """
+    if strategy_id == HOLD_NOTHING:
+        return 0
+    if strategy_id == HOLD_ALL:
+        return 31
+    min_idx = 9 if strategy_id == HOLD_JOB_PAIR else 0  # rank index (rank - 2)
+    for i in range(5):
+        rank_counts[hand[i] >> 2] += 1
+    mask = 0
+    for i in range(5):
+        r = hand[i] >> 2
+        if r >= min_idx and rank_counts[r] >= 2:
+            mask |= 1 << i
+    for i in range(5):
+        rank_counts[hand[i] >> 2] = 0
+    return mask
+
+
+@njit(cache=True)
+def simulate_kernel(paytable_arr, hands, seed, strategy_id, evaluator_id):
+    """
+    Play `hands` hands; returns (per-code hit counts, total per-coin payout).
+
+    `paytable_arr` holds the per-coin payout of each category code of the
+    chosen evaluator.
+    """
+    counts = np.zeros(paytable_arr.shape[0], dtype=np.int64)
+    deck = np.arange(52, dtype=np.int64)
+    hand = np.empty(5, dtype=np.int64)
+    rank_counts = np.zeros(13, dtype=np.int64)
+    state = _splitmix64(np.uint64(seed))
+    total_unit = 0
+
+    for _ in range(hands):
+        top = 0
+        for i in range(5):
+            state = _xorshift64(state)
+            r = top + int(state % np.uint64(52 - top))
+            tmp = deck[top]
+            deck[top] = deck[r]
+            deck[r] = tmp
+            hand[i] = deck[top]
+            top += 1
+
+        mask = _hold_mask(hand, strategy_id, rank_counts)
+        for i in range(5):
+            if not (mask >> i) & 1:
+                state = _xorshift64(state)
+                r = top + int(state % np.uint64(52 - top))
+                tmp = deck[top]
+                deck[top] = deck[r]
+                deck[r] = tmp
+                hand[i] = deck[top]
+                top += 1
+
+        code = _eval_code(hand, evaluator_id)
+        counts[code] += 1
+        total_unit += paytable_arr[code]
+
+    return counts, total_unit
@@ -1,12 +1,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import random
-from typing import Callable, Dict
+from functools import lru_cache, partial
+import multiprocessing
+import os
+import weakref
+from typing import Callable, Dict, Sequence
 
-from .cards import Card
+import numpy as np
+
+from .cards import INT_TO_CARD, RANK, Card
+from .hand_eval import CATEGORY_NAMES, evaluate_hand, evaluate_hand_code
+from . import hand_eval_deuces, hand_eval_deuces_bonus
+from .hand_eval_deuces import evaluate_deuces
+from .hand_eval_deuces_bonus import evaluate_deuces_bonus
+from .hand_eval_np import evaluate_codes_np
 from .hold import HoldDecision
 from .hot_roll import HotRollConfig, expected_multiplier_2d6
+from .xorshift import DRAW_FNS, seed_state
+
+# Optional JIT kernels (JoB only); fall back to the NumPy path without numba.
+try:
+    from ._mc_numba import _mc_ev_all_masks as _mc_ev_all_masks_numba
+except ImportError:
+    _mc_ev_all_masks_numba = None
 
 
 
@@ -14,79 +31,295 @@ from .hot_roll import HotRollConfig, expected_multiplier_2d6
 class McBestConfig:
     trials: int = 200
     seed: int = 42
+    workers: int = 1  # processes for the pure-Python backend (0 = one per core)
+    prune: bool = False  # only simulate _candidate_masks (near-optimal, much faster)
+
+
+def _boxed_code(category_fn: Callable[[list[Card]], int], final: Sequence[int]) -> int:
+    return category_fn([INT_TO_CARD[c] for c in final])
+
+
+# Evaluators with an entry point returning a category code (packed-int
+# native, or Card-based behind _boxed_code), paired with the category names
+# those codes index.
+_CODE_EVALUATORS: Dict[Callable, tuple[Callable[[Sequence[int]], int], Sequence[str]]] = {
+    evaluate_hand: (evaluate_hand_code, CATEGORY_NAMES),
+    evaluate_deuces: (
+        partial(_boxed_code, hand_eval_deuces.evaluate_deuces_category),
+        hand_eval_deuces.CATEGORY_NAMES,
+    ),
+    evaluate_deuces_bonus: (
+        partial(_boxed_code, hand_eval_deuces_bonus.evaluate_deuces_bonus_category),
+        hand_eval_deuces_bonus.CATEGORY_NAMES,
+    ),
+}
+
+
+def _code_evaluator(
+    evaluator: Callable[[list[Card]], object], paytable
+) -> tuple[Callable[[list[int]], int], tuple[int, ...]]:
+    """
+    Adapt `evaluator` to packed-int cards -> category code, and return the
+    payouts indexed by that code. Other evaluators get their cards boxed
+    back into Card objects, and their category strings interned against the
+    paytable keys (unknown categories pay 0).
+    """
+    fast = _CODE_EVALUATORS.get(evaluator)
+    if fast is not None:
+        code_fn, names = fast
+        return code_fn, paytable.payout_tuple(names)
 
+    names = tuple(paytable.payouts)
+    code_of = {name: i for i, name in enumerate(names)}
+    unknown = len(names)
 
-def _fresh_deck_excluding(cards: list[Card]) -> list[Card]:
-    excluded = {(c.rank, c.suit) for c in cards}
-    deck: list[Card] = []
-    for suit in ("C", "D", "H", "S"):
-        for rank in range(2, 15):
-            if (rank, suit) not in excluded:
-                deck.append(Card(rank=rank, suit=suit))
+    def boxed(final: list[int]) -> int:
+        return code_of.get(evaluator([INT_TO_CARD[c] for c in final]).category, unknown)
+
+    return boxed, paytable.payout_tuple(names) + (0,)
+
+
+# Evaluators with a vectorized twin ((N, 5) packed ints -> (N,) category codes),
+# paired with the category names those codes index. These take the NumPy path.
+_VECTOR_EVALUATORS: Dict[Callable, tuple[Callable[[np.ndarray], np.ndarray], Sequence[str]]] = {
+    evaluate_hand: (evaluate_codes_np, CATEGORY_NAMES),
+}
+
+
+@lru_cache(maxsize=4096)
+def _remaining_tuple(key: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    The 47 undealt cards (ascending) for a sorted 5-card key. The result only
+    depends on which cards were dealt, so every ordering of a hand shares one
+    cached tuple.
+    """
+    excluded = 0  # 52-bit set: bit c <=> card c was dealt
+    for c in key:
+        excluded |= 1 << c
+    deck = tuple(c for c in range(52) if not (excluded >> c) & 1)
     if len(deck) != 47:
         raise ValueError(f"Expected 47 remaining cards, got {len(deck)}")
     return deck
 
-def _draw_k(rng: random.Random, remaining: list[Card], k: int) -> tuple[Card, ...]:
-    """Fast draw without replacement. Optimized for small k (<=3)."""
-    n = len(remaining)
-    if k <= 0:
-        return ()
-    if k == 1:
-        return (remaining[rng.randrange(n)],)
-    if k == 2:
-        i = rng.randrange(n)
-        j = rng.randrange(n - 1)
-        if j >= i:
-            j += 1
-        return (remaining[i], remaining[j])
-    if k == 3:
-        i = rng.randrange(n)
-        j = rng.randrange(n - 1)
-        if j >= i:
-            j += 1
-        while True:
-            kidx = rng.randrange(n)
-            if kidx != i and kidx != j:
-                break
-        return (remaining[i], remaining[j], remaining[kidx])
-    # fallback (k 4-5 happens when holding 1 or 0 cards)
-    return tuple(rng.sample(remaining, k))
+
+@lru_cache(maxsize=4096)
+def _remaining_np(key: tuple[int, ...]) -> np.ndarray:
+    """_remaining_tuple as a read-only uint8 array, gathered from by the array backends."""
+    return np.frombuffer(bytes(_remaining_tuple(key)), dtype=np.uint8)
+
+
+# Positions to draw into for each of the 32 hold masks (depends only on the mask)
+_DRAW_POS_LUT: tuple[tuple[int, ...], ...] = tuple(
+    tuple(i for i in range(5) if not (m & (1 << i))) for m in range(32)
+)
+
+
+_ALL_MASKS: tuple[int, ...] = tuple(range(32))
+
+# Rank that plays wild under each evaluator (used only for mask pruning)
+_WILD_RANKS: Dict[Callable, int] = {
+    evaluate_deuces: 2,
+    evaluate_deuces_bonus: 2,
+}
+
+
+def _candidate_masks(init: Sequence[int], wild_rank: int | None = None) -> tuple[int, ...]:
+    """
+    Hold masks worth simulating for packed-int hand `init`, ascending.
+
+    Keeps what a sensible strategy could hold:
+      - nothing, and the pat hand
+      - rank groups (pairs up to quads, and all of them together)
+      - trips plus one kicker (kicker-bonus quads)
+      - any combination of J-A singles
+      - 3+ suited cards, and 2+ suited royal cards
+      - 3+ cards inside one straight window (suited or not)
+    Wild cards are added to every candidate. Everything else is assumed
+    dominated and skipped.
+    """
+    wild = 0
+    by_rank: Dict[int, int] = {}  # rank -> position bits
+    by_suit: Dict[int, int] = {}  # suit -> position bits
+    for i, c in enumerate(init):
+        bit = 1 << i
+        r = RANK(c)
+        if r == wild_rank:
+            wild |= bit
+            continue
+        by_rank[r] = by_rank.get(r, 0) | bit
+        by_suit[c & 3] = by_suit.get(c & 3, 0) | bit
+
+    masks = {0, 31}
+
+    paired = 0
+    high = 0
+    royal = 0
+    for r, m in by_rank.items():
+        if m & (m - 1):  # 2+ cards of this rank
+            masks.add(m)
+            paired |= m
+            if m.bit_count() == 3:
+                for i in range(5):
+                    if not (m | wild) >> i & 1:
+                        masks.add(m | (1 << i))
+        if r >= 11:
+            high |= m
+        if r >= 10:
+            royal |= m
+    masks.add(paired)
+
+    sub = high
+    while sub:  # every non-empty subset of the high cards
+        masks.add(sub)
+        sub = (sub - 1) & high
+
+    for m in by_suit.values():
+        if m.bit_count() >= 3:
+            masks.add(m)
+        if (m & royal).bit_count() >= 2:
+            masks.add(m & royal)
+
+    for lo in range(1, 11):  # windows A-5 .. T-A (ace low as 1)
+        window = 0
+        for r in range(lo, lo + 5):
+            m = by_rank.get(14 if r == 1 else r, 0)
+            window |= m & -m  # one card per rank
+        if window.bit_count() >= 3:
+            masks.add(window)
+            for m in by_suit.values():
+                if (window & m).bit_count() >= 3:
+                    masks.add(window & m)
+
+    if wild:
+        masks = {m | wild for m in masks} | {0}
+    return tuple(sorted(masks))
+
 
 def _mc_ev_for_mask(
     *,
-    paytable,
-    evaluator: Callable[[list[Card]], object],
-    init: list[Card],
+    pay_by_code: Sequence[int],
+    evaluator: Callable[[list[int]], int],
+    init: list[int],
     mask: int,
     trials: int,
-    rng: random.Random,
-    remaining_deck: list[Card],
+    seed: int,
+    remaining_deck: Sequence[int],
     expected_mult: float,
     paytable_bet: int,
+    final: list[int] | None = None,
 ) -> float:
-    # Precompute which positions we will draw into (avoid "i in hold_idx" cost)
-    draw_pos: list[int] = []
-    for i in range(5):
-        if not (mask & (1 << i)):
-            draw_pos.append(i)
-    draw_n = len(draw_pos)
+    """
+    `final` is an optional 5-slot buffer holding `init`, shared across masks of
+    a hand: only draw positions are written, and they are restored on return.
+    """
+    # xorshift64 state lives in a local int for the whole trial loop
+    state = seed_state(seed)
+
+    draw_pos = _DRAW_POS_LUT[mask]
+    draw_fn = DRAW_FNS[len(draw_pos)]  # bound once: no per-trial branch on k
 
-    # Reuse one buffer instead of copying init[:] every trial
-    final = init[:]  # copy once; we only overwrite draw positions
+    if final is None:
+        final = init[:]
 
-    total_pay = 0.0
+    total_unit = 0  # per-coin payouts, integer; scaled once after the loop
     for _ in range(trials):
-        if draw_n:
-            drawn = _draw_k(rng, remaining_deck, draw_n)
-            for di, pos in enumerate(draw_pos):
-                final[pos] = drawn[di]
+        state, drawn = draw_fn(state, remaining_deck)
+        for pos, card in zip(draw_pos, drawn):
+            final[pos] = card
 
-        ev = evaluator(final)
-        unit = paytable.payout_for(ev.category)  # per-coin payout
-        total_pay += (unit * paytable_bet) * expected_mult
+        total_unit += pay_by_code[evaluator(final)]
 
-    return total_pay / trials if trials else 0.0
+    for pos in draw_pos:
+        final[pos] = init[pos]
+
+    return (total_unit * paytable_bet) * expected_mult / trials if trials else 0.0
+
+
+def _draw_rows_np(rng: np.random.Generator, n: int, trials: int, k: int) -> np.ndarray:
+    """(trials, k) indices into a deck of n, distinct within each row (row rejection)."""
+    idx = rng.integers(0, n, size=(trials, k))
+    if k < 2:
+        return idx
+    while True:
+        srt = np.sort(idx, axis=1)
+        dup = (srt[:, 1:] == srt[:, :-1]).any(axis=1)
+        n_dup = int(dup.sum())
+        if not n_dup:
+            return idx
+        idx[dup] = rng.integers(0, n, size=(n_dup, k))
+
+
+def _mc_ev_for_mask_np(
+    *,
+    pay_by_code: np.ndarray,
+    evaluator: Callable[[np.ndarray], np.ndarray],
+    init: np.ndarray,
+    mask: int,
+    trials: int,
+    rng: np.random.Generator,
+    remaining_deck: np.ndarray,
+    expected_mult: float,
+    paytable_bet: int,
+    final: np.ndarray | None = None,
+) -> float:
+    """
+    _mc_ev_for_mask with all trials drawn and evaluated as one (trials, 5) batch.
+
+    `final` is an optional (trials, 5) buffer with every row equal to `init`,
+    shared across masks of a hand the same way as in _mc_ev_for_mask.
+    """
+    if not trials:
+        return 0.0
+    draw_pos = _DRAW_POS_LUT[mask]
+
+    if not draw_pos:
+        # Pat hand: every trial is the same
+        unit = int(pay_by_code[evaluator(init[None, :])[0]])
+        return (unit * paytable_bet) * expected_mult
+
+    if final is None:
+        final = np.repeat(init[None, :], trials, axis=0)
+    cols = list(draw_pos)
+    idx = _draw_rows_np(rng, len(remaining_deck), trials, len(cols))
+    final[:, cols] = remaining_deck[idx]
+
+    total_unit = int(pay_by_code[evaluator(final)].sum())
+    final[:, cols] = init[cols]
+    return (total_unit * paytable_bet) * expected_mult / trials
+
+
+def _mask_seed(hand_seed: int, mask: int) -> int:
+    """Per-mask RNG seed, so masks can be evaluated in any order / in parallel."""
+    return (hand_seed << 5) | mask
+
+
+# Per-process state for the multiprocessing backend (set by _pool_init)
+_WORKER: dict = {}
+
+
+def _pool_init(paytable, evaluator, trials: int, expected_mult: float, paytable_bet: int) -> None:
+    code_fn, pay_by_code = _code_evaluator(evaluator, paytable)
+    _WORKER.update(
+        pay_by_code=pay_by_code,
+        evaluator=code_fn,
+        trials=trials,
+        expected_mult=expected_mult,
+        paytable_bet=paytable_bet,
+    )
+
+
+def _pool_ev_for_mask(mask: int, *, init: list[int], remaining_deck: Sequence[int], hand_seed: int) -> float:
+    return _mc_ev_for_mask(
+        pay_by_code=_WORKER["pay_by_code"],
+        evaluator=_WORKER["evaluator"],
+        init=init,
+        mask=mask,
+        trials=_WORKER["trials"],
+        seed=_mask_seed(hand_seed, mask),
+        remaining_deck=remaining_deck,
+        expected_mult=_WORKER["expected_mult"],
+        paytable_bet=_WORKER["paytable_bet"],
+    )
 
 
 def make_mc_best_strategy(
@@ -97,12 +330,31 @@ def make_mc_best_strategy(
     *,
     hot_roll_cfg: HotRollConfig | None = None,
     hot_roll_paytable_bet: int = 5,
+    workers: int = 1,
+    prune: bool = False,
 ) -> Callable[[list[Card]], HoldDecision]:
+    """
+    Build a strategy that picks, per initial hand, the hold mask with the best
+    Monte Carlo EV. Backend: Numba kernel (JoB, numba installed; masks run in
+    parallel via prange) > NumPy batch (JoB) > pure-Python loop (any
+    evaluator; spread over `workers` processes when workers != 1).
+
+    With prune=True only _candidate_masks are compared instead of all 32.
 
-    
-    cfg = McBestConfig(trials=trials, seed=seed)
+    The returned strategy has a close() that shuts down its worker pool (a
+    no-op without one); an unclosed pool is terminated when the strategy is
+    garbage-collected or the interpreter exits.
+    """
+    cfg = McBestConfig(trials=trials, seed=seed, workers=workers, prune=prune)
+    wild_rank = _WILD_RANKS.get(evaluator)
 
-    cache: Dict[tuple[tuple[int, str], ...], HoldDecision] = {}
+    cache: Dict[tuple[int, ...], HoldDecision] = {}
+    code_evaluator, pay_tuple = _code_evaluator(evaluator, paytable)
+    vector = _VECTOR_EVALUATORS.get(evaluator)
+    if vector is not None:
+        vec_evaluator, category_names = vector
+        pay_by_code = paytable.payout_array(category_names)
+    use_numba = _mc_ev_all_masks_numba is not None and evaluator is evaluate_hand
 
     if hot_roll_cfg is not None:
         expected_mult = expected_multiplier_2d6(hot_roll_cfg.p_per_hand)
@@ -111,30 +363,82 @@ def make_mc_best_strategy(
         expected_mult = 1.0
         paytable_bet = 1
 
+    # One persistent pool per strategy; the paytable/evaluator ship once per worker.
+    # Workers are spawned, never forked from a process that may already run
+    # Numba/TBB threads.
+    pool = None
+    if cfg.workers != 1 and not use_numba and vector is None:
+        pool = multiprocessing.get_context("spawn").Pool(
+            cfg.workers or os.cpu_count(),
+            initializer=_pool_init,
+            initargs=(paytable, evaluator, cfg.trials, expected_mult, paytable_bet),
+        )
 
     def strategy(init: list[Card]) -> HoldDecision:
-        key = tuple((c.rank, c.suit) for c in init)
+        init_ints = [c.idx for c in init]
+        key = tuple(init_ints)
         if key in cache:
             return cache[key]
 
-        rng = random.Random(cfg.seed ^ (hash(key) & 0xFFFFFFFF))
-        remaining = _fresh_deck_excluding(init)
+        hand_seed = cfg.seed ^ (hash(key) & 0xFFFFFFFF)
+        sorted_key = tuple(sorted(init_ints))
+        masks = _candidate_masks(init_ints, wild_rank) if cfg.prune else _ALL_MASKS
 
-        best_mask = 0
-        best_ev = -1.0
-        for mask in range(32):
-            ev = _mc_ev_for_mask(
-                paytable=paytable,
-                evaluator=evaluator,
-                init=init,
-                mask=mask,
+        if use_numba:
+            units = _mc_ev_all_masks_numba(
+                np.array(init_ints, dtype=np.uint8),
+                cfg.trials,
+                _remaining_np(sorted_key),
+                pay_by_code,
+                hand_seed,
+            )
+            # The kernel always covers all 32 masks; pruning only narrows the pick
+            evs = (units[list(masks)] * paytable_bet) * expected_mult
+        elif vector is not None:
+            # Deck and trial buffer are built once per hand and reused by all
+            # 32 masks: each mask only gathers into its own draw columns.
+            init_np = np.array(init_ints, dtype=np.uint8)
+            ev_for_mask = partial(
+                _mc_ev_for_mask_np,
+                pay_by_code=pay_by_code,
+                evaluator=vec_evaluator,
+                init=init_np,
                 trials=cfg.trials,
-                rng=rng,
-                remaining_deck=remaining,
+                rng=np.random.default_rng(hand_seed),
+                remaining_deck=_remaining_np(sorted_key),
                 expected_mult=expected_mult,
                 paytable_bet=paytable_bet,
+                final=np.repeat(init_np[None, :], cfg.trials, axis=0),
+            )
+            evs = [ev_for_mask(mask=mask) for mask in masks]
+        elif pool is not None:
+            remaining = _remaining_tuple(sorted_key)
+            evs = pool.map(
+                partial(_pool_ev_for_mask, init=init_ints, remaining_deck=remaining, hand_seed=hand_seed),
+                masks,
             )
+        else:
+            remaining = _remaining_tuple(sorted_key)  # read-only, shared
+            final = init_ints[:]
+            evs = [
+                _mc_ev_for_mask(
+                    pay_by_code=pay_tuple,
+                    evaluator=code_evaluator,
+                    init=init_ints,
+                    mask=mask,
+                    trials=cfg.trials,
+                    seed=_mask_seed(hand_seed, mask),
+                    remaining_deck=remaining,
+                    expected_mult=expected_mult,
+                    paytable_bet=paytable_bet,
+                    final=final,
+                )
+                for mask in masks
+            ]
 
+        best_mask = 0
+        best_ev = -1.0
+        for mask, ev in zip(masks, evs):
             if ev > best_ev:
                 best_ev = ev
                 best_mask = mask
@@ -143,5 +447,10 @@ def make_mc_best_strategy(
         cache[key] = d
         return d
 
+    if pool is not None:
+        # Calling the finalizer terminates the pool once; later calls are no-ops
+        strategy.close = weakref.finalize(strategy, pool.terminate)
+    else:
+        strategy.close = lambda: None
     return strategy
 
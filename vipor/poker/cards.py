@@ -1,22 +1,98 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Tuple
 
 SUITS = ("S", "H", "D", "C")  # Spades, Hearts, Diamonds, Clubs
 RANKS = tuple(range(2, 15))  # 2..14 (14 = Ace)
 
+_SUIT_INDEX = {s: i for i, s in enumerate(SUITS)}
 
-@dataclass(frozen=True, slots=True)
+
+# ----------------------------
+# Packed int cards
+# ----------------------------
+# Hot loops (MC draws, evaluators) work on plain ints 0..51:
+#   c = (rank - 2) * 4 + suit_index      (suit_index into SUITS)
+# so rank and suit are a shift / mask away and a 5-card flush test is a
+# 5-int compare. Card objects are only needed at API boundaries.
+#
+# Bitboards (wild-card evaluators): a hand is the OR of its Card.bit, one
+# 16-bit lane per suit (lane = suit index), bit rank-2 inside the lane. A
+# lane masked with RANK_LANE is that suit's 13-bit rank set.
+RANK_LANE = 0x1FFF
+
+# Cactus-Kev rank primes (index rank - 2): the product of a hand's
+# Card.prime identifies its rank multiset, whatever the order or suits.
+RANK_PRIMES: Tuple[int, ...] = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Cactus-Kev card word (Card._packed), one 32-bit int per card:
+#   xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+#   b = rank bit (rank - 2), cdhs = suit nibble, r = rank - 2, p = prime
+# so a card's rank, suit and prime are each one shift / mask of one attribute.
+SUIT_NIBBLE: Dict[str, int] = {"S": 0x1, "H": 0x2, "D": 0x4, "C": 0x8}
+
+def RANK(c: int) -> int:
+    """Rank 2..14 of a packed card."""
+    return (c >> 2) + 2
+
+
+def SUIT(c: int) -> int:
+    """Suit index (into SUITS) of a packed card."""
+    return c & 3
+
+
+FULL_DECK52: Tuple[int, ...] = tuple(range(52))
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Card:
     rank: int  # 2..14
     suit: str  # one of SUITS
+    idx: int = field(init=False, repr=False, compare=False)  # packed int 0..51
+    bit: int = field(init=False, repr=False, compare=False)  # bitboard bit
+    prime: int = field(init=False, repr=False, compare=False)  # RANK_PRIMES[rank - 2]
+    _packed: int = field(init=False, repr=False, compare=False)  # Cactus-Kev card word
+
+    def __post_init__(self) -> None:
+        suit_idx = _SUIT_INDEX[self.suit]
+        object.__setattr__(self, "idx", (self.rank - 2) * 4 + suit_idx)
+        object.__setattr__(self, "bit", 1 << (suit_idx * 16 + self.rank - 2))
+        object.__setattr__(self, "prime", RANK_PRIMES[self.rank - 2])
+        object.__setattr__(
+            self,
+            "_packed",
+            (1 << (16 + self.rank - 2)) | (SUIT_NIBBLE[self.suit] << 12) | ((self.rank - 2) << 8) | self.prime,
+        )
+
+    # Identity is the packed word (unique per rank/suit): one int compare or
+    # hash instead of the generated (rank, suit) tuple ones.
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Card):
+            return self._packed == other._packed
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._packed
 
     def __str__(self) -> str:
         r = {11: "J", 12: "Q", 13: "K", 14: "A"}.get(self.rank, str(self.rank))
         return f"{r}{self.suit}"
 
 
+# One interned Card per packed int, for converting back at API boundaries.
+INT_TO_CARD: Tuple[Card, ...] = tuple(Card(rank=RANK(c), suit=SUITS[SUIT(c)]) for c in FULL_DECK52)
+CARD_TO_INT: Dict[Card, int] = {card: card.idx for card in INT_TO_CARD}
+INT_TO_STR: Tuple[str, ...] = tuple(str(card) for card in INT_TO_CARD)
+
+
+def card_to_int(card: Card) -> int:
+    return card.idx
+
+
+def int_to_card(c: int) -> Card:
+    return INT_TO_CARD[c]
+
+
 def cards_str(cards: Iterable[Card]) -> str:
     return " ".join(str(c) for c in cards)
-
@@ -3,7 +3,16 @@ from __future__ import annotations
 import random
 from typing import List, Optional
 
-from .cards import Card
+from .cards import INT_TO_CARD, Card
+
+# Interned cards in a fixed fresh-deck order (suit-major C,D,H,S). deal/draw
+# pick positions from it, so a given seed always deals the same hands, and a
+# reset allocates no Cards.
+_FRESH_52 = tuple(
+    INT_TO_CARD[Card(rank, suit).idx]
+    for suit in ("C", "D", "H", "S")
+    for rank in range(2, 15)
+)
 
 
 class Deck:
@@ -18,36 +27,49 @@ class Deck:
         self.reset()
 
     def _fresh_52(self) -> List[Card]:
-        return [
-            Card(rank, suit)
-            for suit in ("C", "D", "H", "S")
-            for rank in range(2, 15)
-        ]
+        return list(_FRESH_52)
 
     def reset(self) -> None:
         """
-        Reset deck back to its initial composition, then shuffle.
+        Reset deck back to its initial composition.
         - If initialized with cards=[...], resets to those cards.
         - Else resets to a fresh 52-card deck.
+        The deck is not shuffled here: deal/draw pick uniformly at random from
+        what is left, so only the cards actually taken get randomized.
         """
         if self._initial_cards is not None:
             self.cards = list(self._initial_cards)
         else:
             self.cards = self._fresh_52()
-        self.shuffle()
 
     def shuffle(self) -> None:
         self.rng.shuffle(self.cards)
 
     def deal(self, n: int) -> List[Card]:
-        if n > len(self.cards):
+        cards = self.cards
+        size = len(cards)
+        if n > size:
             raise ValueError("Not enough cards left to deal")
-        out = self.cards[:n]
-        del self.cards[:n]
+        # Partial Fisher-Yates over the first n positions only
+        randrange = self.rng.randrange
+        for i in range(n):
+            j = randrange(i, size)
+            cards[i], cards[j] = cards[j], cards[i]
+        out = cards[:n]
+        del cards[:n]
         return out
 
     def draw(self) -> Card:
-        if not self.cards:
+        cards = self.cards
+        if not cards:
             raise ValueError("No cards left to draw")
-        return self.cards.pop(0)
+        # Swap a random card to the end and pop it (O(1), no shift)
+        j = self.rng.randrange(len(cards))
+        cards[j], cards[-1] = cards[-1], cards[j]
+        return cards.pop()
 
+    def draw_sample(self, n: int) -> List[Card]:
+        """n distinct random cards, leaving the deck untouched (no state tracking)."""
+        if n > len(self.cards):
+            raise ValueError("Not enough cards left to deal")
+        return self.rng.sample(self.cards, n)
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
-from .cards import Card, RANKS, SUITS
-from .hand_eval import evaluate_hand
+from .cards import FULL_DECK52, Card
+from .hand_eval import CATEGORY_NAMES, NUM_CATEGORIES, evaluate_hand_code
 from .paytable import PayTable
+from .xorshift import DRAW_FNS, seed_state
 
-FULL_DECK: List[Card] = [Card(rank=r, suit=s) for s in SUITS for r in RANKS]
+FULL_DECK: List[int] = list(FULL_DECK52)  # packed int cards
 
 
 def parse_card(tok: str) -> Card:
@@ -66,28 +66,36 @@ def frozen_ev_mc(
     bet_per_hand: int = 1,
     seed: int = 1,
 ) -> FrozenResult:
-    rng = random.Random(seed)
+    state = seed_state(seed)
 
-    dealt = set(initial)
-    remaining = [c for c in FULL_DECK if c not in dealt]
+    init_ints = [c.idx for c in initial]
+    dealt = 0  # 52-bit set of the dealt cards
+    for c in init_ints:
+        dealt |= 1 << c
+    remaining = [c for c in FULL_DECK if not (dealt >> c) & 1]
 
     draw_positions = [i for i in range(5) if not (hold_mask & (1 << i))]
-    draw_n = len(draw_positions)
+    draw_fn = DRAW_FNS[len(draw_positions)]
 
+    pay_by_code = paytable.payout_tuple(CATEGORY_NAMES)
     total_payout = 0
-    cat_counts: Dict[str, int] = {}
+    counts = [0] * NUM_CATEGORIES  # indexed by category code
 
+    # One 5-slot buffer for all trials: held slots never change and every
+    # draw slot is overwritten each trial, so no per-trial copy is needed.
+    final = init_ints[:]
     for _ in range(trials):
-        drawn = rng.sample(remaining, draw_n) if draw_n else []
-        final = initial[:]
+        state, drawn = draw_fn(state, remaining)
         for pos, new_card in zip(draw_positions, drawn):
             final[pos] = new_card
 
-        cat = evaluate_hand(final).category
-        cat_counts[cat] = cat_counts.get(cat, 0) + 1
-        total_payout += paytable.payout_for(cat) * bet_per_hand
+        code = evaluate_hand_code(final)
+        counts[code] += 1
+        total_payout += pay_by_code[code]
 
+    total_payout *= bet_per_hand
     avg_payout = total_payout / trials if trials else 0.0
+    cat_counts = {CATEGORY_NAMES[code]: n for code, n in enumerate(counts) if n}
     avg_net = avg_payout - bet_per_hand
 
     return FrozenResult(
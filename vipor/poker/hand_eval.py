@@ -1,6 +1,5 @@
-from collections import Counter
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Sequence, Tuple
 
 from .cards import Card
 
@@ -19,73 +18,182 @@ TWO_PAIR = "two_pair"
 JOB = "jacks_or_better"
 NOTHING = "nothing"
 
+# Small int category codes used on the hot path; CATEGORY_NAMES[code] is the
+# paytable key. Ordered weakest to strongest.
+CATEGORY_NAMES = (
+    NOTHING,
+    JOB,
+    TWO_PAIR,
+    THREE,
+    STRAIGHT,
+    FLUSH,
+    FULL_HOUSE,
+    FOUR,
+    FOUR_234,
+    FOUR_LOW_ACE,
+    FOUR_ACES,
+    FOUR_ACES_234,
+    STRAIGHT_FLUSH,
+    ROYAL_FLUSH,
+)
+NUM_CATEGORIES = len(CATEGORY_NAMES)
+CATEGORY_CODE: Dict[str, int] = {name: i for i, name in enumerate(CATEGORY_NAMES)}
+
+(
+    CODE_NOTHING,
+    CODE_JOB,
+    CODE_TWO_PAIR,
+    CODE_THREE,
+    CODE_STRAIGHT,
+    CODE_FLUSH,
+    CODE_FULL_HOUSE,
+    CODE_FOUR,
+    CODE_FOUR_234,
+    CODE_FOUR_LOW_ACE,
+    CODE_FOUR_ACES,
+    CODE_FOUR_ACES_234,
+    CODE_STRAIGHT_FLUSH,
+    CODE_ROYAL_FLUSH,
+) = range(NUM_CATEGORIES)
+
 
 @dataclass(frozen=True)
 class HandResult:
     category: str
+    category_code: int = -1  # index into CATEGORY_NAMES; derived from category when omitted
+
+    def __post_init__(self) -> None:
+        if self.category_code == -1:
+            object.__setattr__(self, "category_code", CATEGORY_CODE.get(self.category, -1))
+
+
+# One immutable result per category, so the wrappers below never allocate
+_RESULTS: Tuple[HandResult, ...] = tuple(HandResult(name, code) for code, name in enumerate(CATEGORY_NAMES))
+
+# Cactus-Kev path (Card._packed): 13-bit rank sets (bit rank - 2) of the ten
+# straights, wheel included, and of the royal.
+_STRAIGHT_RANK_SETS = frozenset([0x1F << s for s in range(9)] + [0x100F])
+_ROYAL_RANK_SET = 0x1F00
+
+# Prime product -> category code for hands with a repeated rank (the rank
+# multiset fixes the JoB category there). Filled lazily by _evaluate_five_int.
+_PAIRED_LUT: Dict[int, int] = {}
+
+
+def _sort5(a: int, b: int, c: int, d: int, e: int) -> tuple[int, int, int, int, int]:
+    """Optimal 9 compare-swap sorting network for 5 values."""
+    if a > b: a, b = b, a
+    if d > e: d, e = e, d
+    if c > e: c, e = e, c
+    if c > d: c, d = d, c
+    if a > d: a, d = d, a
+    if a > c: a, c = c, a
+    if b > e: b, e = e, b
+    if b > d: b, d = d, b
+    if b > c: b, c = c, b
+    return a, b, c, d, e
+
+
+def _evaluate_five_int(c0: int, c1: int, c2: int, c3: int, c4: int) -> int:
+    """
+    Classify 5 packed-int cards (see cards.py); returns a category code.
+
+    No Counter/dict/set: the 5 ranks are sorted with a network and the hand
+    shape is read off the 4 adjacent-equality flags.
+    """
+    r0, r1, r2, r3, r4 = _sort5(c0 >> 2, c1 >> 2, c2 >> 2, c3 >> 2, c4 >> 2)
+    r0 += 2; r1 += 2; r2 += 2; r3 += 2; r4 += 2
+
+    e01 = r0 == r1
+    e12 = r1 == r2
+    e23 = r2 == r3
+    e34 = r3 == r4
+    pair_count = e01 + e12 + e23 + e34
+
+    if pair_count == 0:
+        # 5 distinct ranks: the only shapes where flush/straight are possible
+        straight = r4 - r0 == 4 or (r3 == 5 and r4 == 14)  # wheel: A-2-3-4-5
+        s0 = c0 & 3
+        if s0 == (c1 & 3) == (c2 & 3) == (c3 & 3) == (c4 & 3):
+            if straight:
+                return CODE_ROYAL_FLUSH if r0 == 10 else CODE_STRAIGHT_FLUSH
+            return CODE_FLUSH
+        return CODE_STRAIGHT if straight else CODE_NOTHING
+
+    if pair_count == 3:
+        if e12 and e23:
+            # Quads sit at 0..3 (kicker r4) or 1..4 (kicker r0)
+            if e01:
+                quad_rank, kicker_rank = r0, r4
+            else:
+                quad_rank, kicker_rank = r4, r0
+
+            if quad_rank == 14:
+                # Aces
+                if kicker_rank <= 4:
+                    return CODE_FOUR_ACES_234
+                return CODE_FOUR_ACES
+
+            if quad_rank <= 4:
+                # 2–4 quads
+                if kicker_rank <= 4 or kicker_rank == 14:
+                    return CODE_FOUR_LOW_ACE
+                return CODE_FOUR_234
+
+            # 5–K quads
+            return CODE_FOUR
+        return CODE_FULL_HOUSE
+
+    if pair_count == 2:
+        if (e01 and e12) or (e12 and e23) or (e23 and e34):
+            return CODE_THREE
+        return CODE_TWO_PAIR
+
+    # One pair: r1 or r3 is always part of it
+    pair_rank = r1 if (e01 or e12) else r3
+    return CODE_JOB if pair_rank >= 11 else CODE_NOTHING
+
+
+def evaluate_hand_code(cards: Sequence[int]) -> int:
+    """Category code for 5 packed-int cards (the MC hot path; no result object)."""
+    return _evaluate_five_int(cards[0], cards[1], cards[2], cards[3], cards[4])
+
+
+def evaluate_hand_int(cards: Sequence[int]) -> HandResult:
+    """evaluate_hand for packed-int cards."""
+    if len(cards) != 5:
+        raise ValueError("evaluate_hand expects exactly 5 cards")
+    return _RESULTS[_evaluate_five_int(cards[0], cards[1], cards[2], cards[3], cards[4])]
 
 
-def _is_straight(unique_sorted: List[int]) -> bool:
-    # Requires 5 unique ranks
-    if len(unique_sorted) != 5:
-        return False
-    # Wheel: A-2-3-4-5
-    if unique_sorted == [2, 3, 4, 5, 14]:
-        return True
-    start = unique_sorted[0]
-    return unique_sorted == list(range(start, start + 5))
-
+def evaluate_hand_category(cards: Sequence[Card]) -> int:
+    """
+    Category code for 5 Cards; evaluate_hand without the result object.
 
-def evaluate_hand(cards: List[Card]) -> HandResult:
+    Cactus-Kev style on the cards' packed words: five distinct ranks are
+    settled by the OR'd rank bits and the AND'd suit nibbles, anything
+    paired by one table load keyed by the prime product.
+    """
     if len(cards) != 5:
         raise ValueError("evaluate_hand expects exactly 5 cards")
 
-    ranks = sorted(c.rank for c in cards)
-    counts = Counter(ranks)
-    shape = sorted(counts.values(), reverse=True)
-    unique = sorted(counts.keys())
-
-    flush = len({c.suit for c in cards}) == 1
-    straight = _is_straight(unique)
-
-    if flush and straight:
-        if set(unique) == {10, 11, 12, 13, 14}:
-            return HandResult(ROYAL_FLUSH)
-        return HandResult(STRAIGHT_FLUSH)
-
-    if shape == [4, 1]:
-        quad_rank = next(r for r, c in counts.items() if c == 4)
-        kicker_rank = next(r for r, c in counts.items() if c == 1)
-
-        if quad_rank == 14:
-            # Aces
-            if kicker_rank in (2, 3, 4):
-                return HandResult(FOUR_ACES_234)
-            return HandResult(FOUR_ACES)
-
-        if quad_rank in (2, 3, 4):
-            # 2–4 quads
-            if kicker_rank in (14, 2, 3, 4):
-                return HandResult(FOUR_LOW_ACE)
-            return HandResult(FOUR_234)
-
-        # 5–K quads
-        return HandResult(FOUR)
-
-    if shape == [3, 2]:
-        return HandResult(FULL_HOUSE)
-    if flush:
-        return HandResult(FLUSH)
-    if straight:
-        return HandResult(STRAIGHT)
-
-    if shape == [3, 1, 1]:
-        return HandResult(THREE)
-    if shape == [2, 2, 1]:
-        return HandResult(TWO_PAIR)
-    if shape == [2, 1, 1, 1]:
-        pair_rank = max(r for r, c in counts.items() if c == 2)
-        return HandResult(JOB if pair_rank >= 11 else NOTHING)
-
-    return HandResult(NOTHING)
+    c0, c1, c2, c3, c4 = cards
+    p0 = c0._packed; p1 = c1._packed; p2 = c2._packed; p3 = c3._packed; p4 = c4._packed
+    rank_set = (p0 | p1 | p2 | p3 | p4) >> 16
+    if rank_set.bit_count() == 5:
+        straight = rank_set in _STRAIGHT_RANK_SETS
+        if p0 & p1 & p2 & p3 & p4 & 0xF000:
+            if straight:
+                return CODE_ROYAL_FLUSH if rank_set == _ROYAL_RANK_SET else CODE_STRAIGHT_FLUSH
+            return CODE_FLUSH
+        return CODE_STRAIGHT if straight else CODE_NOTHING
+
+    key = (p0 & 0x3F) * (p1 & 0x3F) * (p2 & 0x3F) * (p3 & 0x3F) * (p4 & 0x3F)
+    code = _PAIRED_LUT.get(key)
+    if code is None:
+        code = _PAIRED_LUT[key] = _evaluate_five_int(c0.idx, c1.idx, c2.idx, c3.idx, c4.idx)
+    return code
 
+
+def evaluate_hand(cards: List[Card]) -> HandResult:
+    return _RESULTS[evaluate_hand_category(cards)]
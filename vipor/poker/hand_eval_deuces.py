@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Sequence, Tuple
+from typing import Dict, Sequence, Tuple
 
-from .cards import Card
+from .cards import RANK_LANE, Card
 
 # Deuces Wild categories (common set; paytables may vary)
 NATURAL_ROYAL_FLUSH = "natural_royal_flush"
@@ -18,64 +18,125 @@ STRAIGHT = "straight"
 THREE_OF_A_KIND = "three_of_a_kind"
 NOTHING = "nothing"
 
+# Small int category codes (EvalResult.category_code, the array backends);
+# CATEGORY_NAMES[code] is the paytable key. Ordered weakest to strongest
+# (evaluation precedence).
+CATEGORY_NAMES = (
+    NOTHING,
+    THREE_OF_A_KIND,
+    STRAIGHT,
+    FLUSH,
+    FULL_HOUSE,
+    FOUR_OF_A_KIND,
+    STRAIGHT_FLUSH,
+    FIVE_OF_A_KIND,
+    WILD_ROYAL_FLUSH,
+    FOUR_DEUCES,
+    NATURAL_ROYAL_FLUSH,
+)
+NUM_CATEGORIES = len(CATEGORY_NAMES)
+CATEGORY_CODE: Dict[str, int] = {name: i for i, name in enumerate(CATEGORY_NAMES)}
+
+(
+    CODE_NOTHING,
+    CODE_THREE_OF_A_KIND,
+    CODE_STRAIGHT,
+    CODE_FLUSH,
+    CODE_FULL_HOUSE,
+    CODE_FOUR_OF_A_KIND,
+    CODE_STRAIGHT_FLUSH,
+    CODE_FIVE_OF_A_KIND,
+    CODE_WILD_ROYAL_FLUSH,
+    CODE_FOUR_DEUCES,
+    CODE_NATURAL_ROYAL_FLUSH,
+) = range(NUM_CATEGORIES)
+
 
 @dataclass(frozen=True)
 class EvalResult:
     category: str
+    category_code: int = -1  # index into CATEGORY_NAMES; derived from category when omitted
 
+    def __post_init__(self) -> None:
+        if self.category_code == -1:
+            object.__setattr__(self, "category_code", CATEGORY_CODE.get(self.category, -1))
 
-ROYAL_SEQ = (10, 11, 12, 13, 14)  # T J Q K A
-# All possible 5-card straight sequences (Ace-low included)
-STRAIGHT_SEQS: List[Tuple[int, int, int, int, int]] = [
-    (14, 2, 3, 4, 5),  # wheel
-    (2, 3, 4, 5, 6),
-    (3, 4, 5, 6, 7),
-    (4, 5, 6, 7, 8),
-    (5, 6, 7, 8, 9),
-    (6, 7, 8, 9, 10),
-    (7, 8, 9, 10, 11),
-    (8, 9, 10, 11, 12),
-    (9, 10, 11, 12, 13),
-    (10, 11, 12, 13, 14),
-]
-
-
-def _count_deuces(cards: Sequence[Card]) -> int:
-    return sum(1 for c in cards if c.rank == 2)
-
-
-def _naturals(cards: Sequence[Card]) -> List[Card]:
-    return [c for c in cards if c.rank != 2]
-
-
-def _rank_counts(naturals: Sequence[Card]) -> Dict[int, int]:
-    d: Dict[int, int] = {}
-    for c in naturals:
-        d[c.rank] = d.get(c.rank, 0) + 1
-    return d
 
+# One immutable result per category, so evaluation never allocates
+_RESULTS: Tuple[EvalResult, ...] = tuple(EvalResult(name, code) for code, name in enumerate(CATEGORY_NAMES))
 
-def _all_naturals_same_suit(naturals: Sequence[Card]) -> bool:
-    if not naturals:
-        return True  # all wilds can choose a suit
-    s = naturals[0].suit
-    return all(c.suit == s for c in naturals)
 
+# Rank-set masks in the bitboard lane layout (bit rank-2; see cards.py):
+# the ten straights, wheel first
+STRAIGHT_MASKS: Tuple[int, ...] = (
+    0x100F,  # wheel: A + 2..5
+    0x001F,
+    0x003E,
+    0x007C,
+    0x00F8,
+    0x01F0,
+    0x03E0,
+    0x07C0,
+    0x0F80,
+    0x1F00,  # T..A
+)
+ROYAL_MASK = 0x1F00
 
-def _can_make_sequence(naturals: Sequence[Card], wilds: int, seq: Tuple[int, ...]) -> bool:
-    """Can we realize this exact 5-rank straight seq with given naturals + wilds?"""
-    natural_ranks = {c.rank for c in naturals}
-    present = sum(1 for r in seq if r in natural_ranks)
-    missing = 5 - present
-    return missing <= wilds
+DEUCE_MASK = 0x0001_0001_0001_0001  # the deuce bit of every suit lane
 
 
-def _can_make_any_straight(naturals: Sequence[Card], wilds: int) -> bool:
-    return any(_can_make_sequence(naturals, wilds, seq) for seq in STRAIGHT_SEQS)
+def _summarize(cards: Sequence[Card]) -> Tuple[int, int, Dict[int, int]]:
+    """
+    (wilds, naturals bitboard, natural rank counts), all from the OR of the
+    cards' Card.bit; shared by both deuces evaluators. A rank's count is the
+    popcount of its bit across the four suit lanes.
+    """
+    hand64 = 0
+    for c in cards:
+        hand64 |= c.bit
+    wild_mask = hand64 & DEUCE_MASK
+    nat64 = hand64 ^ wild_mask
+
+    rc: Dict[int, int] = {}
+    ranks = _ranks_any(nat64)
+    while ranks:
+        low = ranks & -ranks
+        i = low.bit_length() - 1  # rank - 2
+        rc[i + 2] = ((nat64 >> i) & DEUCE_MASK).bit_count()
+        ranks ^= low
+    return wild_mask.bit_count(), nat64, rc
+
+
+def _ranks_any(nat64: int) -> int:
+    """13-bit set of ranks present in any suit."""
+    return (nat64 | (nat64 >> 16) | (nat64 >> 32) | (nat64 >> 48)) & RANK_LANE
+
+
+def _all_naturals_same_suit(nat64: int) -> bool:
+    # At most one non-empty suit lane (no naturals: all wilds can choose a suit)
+    lanes = (
+        bool(nat64 & RANK_LANE)
+        + bool((nat64 >> 16) & RANK_LANE)
+        + bool((nat64 >> 32) & RANK_LANE)
+        + bool(nat64 >> 48)
+    )
+    return lanes <= 1
+
+
+def _can_make_mask(nmask: int, wilds: int, smask: int) -> bool:
+    """Can wilds fill every rank of `smask` missing from the natural rank set `nmask`?"""
+    return (smask & ~nmask).bit_count() <= wilds
+
+
+def _can_make_any_straight(ranks_any: int, wilds: int) -> bool:
+    for straight_mask in STRAIGHT_MASKS:
+        if _can_make_mask(ranks_any, wilds, straight_mask):
+            return True
+    return False
 
 
-def _can_make_royal(naturals: Sequence[Card], wilds: int) -> bool:
-    return _can_make_sequence(naturals, wilds, ROYAL_SEQ)
+def _can_make_royal(ranks_any: int, wilds: int) -> bool:
+    return _can_make_mask(ranks_any, wilds, ROYAL_MASK)
 
 
 def _can_make_five_kind(rank_counts: Dict[int, int], wilds: int) -> bool:
@@ -99,33 +160,23 @@ def _can_make_n_of_kind(rank_counts: Dict[int, int], wilds: int, n: int) -> bool
 
 def _can_make_full_house(rank_counts: Dict[int, int], wilds: int) -> bool:
     """
-    Determine if we can make a full house (3+2) with rank counts + wilds.
-    Brute-force small search over plausible ranks.
+    Trips + pair on two different ranks, wilds filling the gaps. Closed form:
+    the cheapest choice is always trips from the largest natural count and
+    the pair from the second largest (0 if absent; unused ranks are free).
     """
-    # Candidate ranks: any existing natural ranks, plus a few "virtual" ranks (3..14 excluding deuce=2)
-    candidates = set(rank_counts.keys()) | {3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14}
-
-    for r3 in candidates:
-        c3 = rank_counts.get(r3, 0)
-        need3 = max(0, 3 - c3)
-        if need3 > wilds:
-            continue
-        w2 = wilds - need3
-
-        for r2 in candidates:
-            if r2 == r3:
-                continue
-            c2 = rank_counts.get(r2, 0)
-            need2 = max(0, 2 - c2)
-            if need2 <= w2:
-                return True
-
-    return False
+    a = b = 0  # largest and second-largest natural rank counts
+    for cnt in rank_counts.values():
+        if cnt > a:
+            a, b = cnt, a
+        elif cnt > b:
+            b = cnt
+    return max(0, 3 - a) + max(0, 2 - b) <= wilds
 
 
-def evaluate_deuces(cards: Sequence[Card]) -> EvalResult:
+def _evaluate_deuces_code(cards: Sequence[Card]) -> int:
     """
-    Deuces Wild evaluator (no kickers, no joker).
+    Reference Deuces Wild cascade (no kickers, no joker); returns a category
+    code. Fills the lookup tables behind evaluate_deuces.
 
     Ranking order used (typical DW paytables):
       natural_royal_flush
@@ -140,56 +191,90 @@ def evaluate_deuces(cards: Sequence[Card]) -> EvalResult:
       three_of_a_kind
       nothing
     """
-    if len(cards) != 5:
-        raise ValueError("evaluate_deuces expects exactly 5 cards")
+    wilds, nat64, rc = _summarize(cards)
+    ranks_any = _ranks_any(nat64)
 
-    wilds = _count_deuces(cards)
-    naturals = _naturals(cards)
-    rc = _rank_counts(naturals)
+    # Shared by several categories below: compute once. A straight needs five
+    # distinct ranks, so paired naturals skip the straight-mask scan entirely.
+    same_suit = _all_naturals_same_suit(nat64)
+    straight = ranks_any.bit_count() + wilds == 5 and _can_make_any_straight(ranks_any, wilds)
 
     # ---- Top hands ----
     # Natural royal flush: no wilds AND already a royal flush
     # (We detect this as: all 5 are naturals, same suit, ranks are exactly royal set)
-    if wilds == 0 and _all_naturals_same_suit(naturals):
-        nr = sorted({c.rank for c in naturals})
-        if tuple(nr) == ROYAL_SEQ:
-            return EvalResult(NATURAL_ROYAL_FLUSH)
+    if wilds == 0 and same_suit and ranks_any == ROYAL_MASK:
+        return CODE_NATURAL_ROYAL_FLUSH
 
     # Four deuces: exactly 4 wilds (all deuces)
     if wilds == 4:
-        return EvalResult(FOUR_DEUCES)
+        return CODE_FOUR_DEUCES
 
     # Wild royal flush: can make royal AND can make flush suit with naturals
-    if wilds > 0 and _all_naturals_same_suit(naturals) and _can_make_royal(naturals, wilds):
-        return EvalResult(WILD_ROYAL_FLUSH)
+    if wilds > 0 and same_suit and _can_make_royal(ranks_any, wilds):
+        return CODE_WILD_ROYAL_FLUSH
 
     # Five of a kind
     if wilds > 0 and _can_make_five_kind(rc, wilds):
-        return EvalResult(FIVE_OF_A_KIND)
+        return CODE_FIVE_OF_A_KIND
 
     # Straight flush
-    if _all_naturals_same_suit(naturals) and _can_make_any_straight(naturals, wilds):
-        return EvalResult(STRAIGHT_FLUSH)
+    if same_suit and straight:
+        return CODE_STRAIGHT_FLUSH
 
     # Four of a kind
     if _can_make_n_of_kind(rc, wilds, 4):
-        return EvalResult(FOUR_OF_A_KIND)
+        return CODE_FOUR_OF_A_KIND
 
     # Full house
     if _can_make_full_house(rc, wilds):
-        return EvalResult(FULL_HOUSE)
+        return CODE_FULL_HOUSE
 
     # Flush
-    if _all_naturals_same_suit(naturals):
-        return EvalResult(FLUSH)
+    if same_suit:
+        return CODE_FLUSH
 
     # Straight
-    if _can_make_any_straight(naturals, wilds):
-        return EvalResult(STRAIGHT)
+    if straight:
+        return CODE_STRAIGHT
 
     # Three of a kind
     if _can_make_n_of_kind(rc, wilds, 3):
-        return EvalResult(THREE_OF_A_KIND)
+        return CODE_THREE_OF_A_KIND
+
+    return CODE_NOTHING
+
 
-    return EvalResult(NOTHING)
+# Category code per rank multiset (the product of the cards' Card.prime),
+# split by whether the naturals share a suit; each of the few thousand
+# classes is classified by _evaluate_deuces_code the first time it is seen.
+_MIXED_LUT: Dict[int, int] = {}
+_SUITED_LUT: Dict[int, int] = {}
 
+
+def evaluate_deuces_category(cards: Sequence[Card]) -> int:
+    """
+    Deuces Wild category code for 5 Cards (no kickers, no joker); see
+    _evaluate_deuces_code for the ranking order. One table load keyed by the
+    cards' prime product, picked by whether the naturals share a suit.
+    """
+    if len(cards) != 5:
+        raise ValueError("evaluate_deuces expects exactly 5 cards")
+
+    c0, c1, c2, c3, c4 = cards
+    hand64 = c0.bit | c1.bit | c2.bit | c3.bit | c4.bit
+    nat64 = hand64 & ~DEUCE_MASK
+    lut = _SUITED_LUT if _all_naturals_same_suit(nat64) else _MIXED_LUT
+    key = c0.prime * c1.prime * c2.prime * c3.prime * c4.prime
+    code = lut.get(key)
+    if code is None:
+        code = _evaluate_deuces_code(cards)
+        # Only a hand of 5 distinct cards may fill its class: one with a
+        # repeated card is misread off the bitboard, and would poison the table
+        if hand64.bit_count() == 5:
+            lut[key] = code
+    return code
+
+
+def evaluate_deuces(cards: Sequence[Card]) -> EvalResult:
+    """Deuces Wild evaluator; evaluate_deuces_category wrapped in its EvalResult."""
+    return _RESULTS[evaluate_deuces_category(cards)]
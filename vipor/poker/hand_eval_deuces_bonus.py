@@ -1,9 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Sequence, Tuple
+from typing import Dict, Sequence, Tuple
 
 from .cards import Card
+from .hand_eval_deuces import (
+    DEUCE_MASK,
+    ROYAL_MASK,
+    _all_naturals_same_suit,
+    _can_make_any_straight,
+    _can_make_royal,
+    _ranks_any,
+    _summarize,
+)
 
 # Deuces Wild Bonus categories (IGT-style; paytable decides exact payouts)
 NATURAL_ROYAL_FLUSH = "natural_royal_flush"
@@ -21,104 +30,61 @@ STRAIGHT = "straight"
 THREE_OF_A_KIND = "three_of_a_kind"
 NOTHING = "nothing"
 
+# Small int category codes (EvalResult.category_code, the array backends);
+# CATEGORY_NAMES[code] is the paytable key. Ordered weakest to strongest
+# (evaluation precedence).
+CATEGORY_NAMES = (
+    NOTHING,
+    THREE_OF_A_KIND,
+    STRAIGHT,
+    FLUSH,
+    FULL_HOUSE,
+    FOUR_OF_A_KIND,
+    STRAIGHT_FLUSH,
+    FIVE_6_TO_K,
+    FIVE_345,
+    FIVE_ACES,
+    WILD_ROYAL_FLUSH,
+    FOUR_DEUCES,
+    FOUR_DEUCES_WITH_ACE,
+    NATURAL_ROYAL_FLUSH,
+)
+NUM_CATEGORIES = len(CATEGORY_NAMES)
+CATEGORY_CODE: Dict[str, int] = {name: i for i, name in enumerate(CATEGORY_NAMES)}
+
+(
+    CODE_NOTHING,
+    CODE_THREE_OF_A_KIND,
+    CODE_STRAIGHT,
+    CODE_FLUSH,
+    CODE_FULL_HOUSE,
+    CODE_FOUR_OF_A_KIND,
+    CODE_STRAIGHT_FLUSH,
+    CODE_FIVE_6_TO_K,
+    CODE_FIVE_345,
+    CODE_FIVE_ACES,
+    CODE_WILD_ROYAL_FLUSH,
+    CODE_FOUR_DEUCES,
+    CODE_FOUR_DEUCES_WITH_ACE,
+    CODE_NATURAL_ROYAL_FLUSH,
+) = range(NUM_CATEGORIES)
+
 
 @dataclass(frozen=True)
 class EvalResult:
     category: str
+    category_code: int = -1  # index into CATEGORY_NAMES; derived from category when omitted
 
+    def __post_init__(self) -> None:
+        if self.category_code == -1:
+            object.__setattr__(self, "category_code", CATEGORY_CODE.get(self.category, -1))
 
-ROYAL_SEQ = (10, 11, 12, 13, 14)  # T J Q K A
-STRAIGHT_SEQS: List[Tuple[int, int, int, int, int]] = [
-    (14, 2, 3, 4, 5),  # wheel (A2345)
-    (2, 3, 4, 5, 6),
-    (3, 4, 5, 6, 7),
-    (4, 5, 6, 7, 8),
-    (5, 6, 7, 8, 9),
-    (6, 7, 8, 9, 10),
-    (7, 8, 9, 10, 11),
-    (8, 9, 10, 11, 12),
-    (9, 10, 11, 12, 13),
-    (10, 11, 12, 13, 14),
-]
-
-# If your ranks are typical poker ints: 2..14 (Ace=14)
-RANK_TO_BIT = {r: (1 << i) for i, r in enumerate(range(2, 15))}
-
-# Replace STRAIGHT_SEQ_MASKS definition with bitwise OR:
-STRAIGHT_SEQ_MASKS = tuple(
-    (RANK_TO_BIT[seq[0]] | RANK_TO_BIT[seq[1]] | RANK_TO_BIT[seq[2]] | RANK_TO_BIT[seq[3]] | RANK_TO_BIT[seq[4]])
-    for seq in STRAIGHT_SEQS
-)
-
-ROYAL_MASK = (
-    RANK_TO_BIT[10] | RANK_TO_BIT[11] | RANK_TO_BIT[12] | RANK_TO_BIT[13] | RANK_TO_BIT[14]
-)
-
-def _can_make_royal(naturals: Sequence[Card], wilds: int) -> bool:
-    natural_mask = _naturals_rank_mask(naturals)
-    missing = (ROYAL_MASK & ~natural_mask).bit_count()
-    return missing <= wilds
-
-# If you want to keep _can_make_sequence around, also speed it up:
-def _can_make_sequence(naturals: Sequence[Card], wilds: int, seq: Tuple[int, ...]) -> bool:
-    natural_mask = _naturals_rank_mask(naturals)
-    seq_mask = 0
-    for r in seq:
-        seq_mask |= RANK_TO_BIT[r]
-    missing = (seq_mask & ~natural_mask).bit_count()
-    return missing <= wilds
-
-
-
-def _count_deuces(cards: Sequence[Card]) -> int:
-    return sum(1 for c in cards if c.rank == 2)
-
-
-def _naturals(cards: Sequence[Card]) -> List[Card]:
-    return [c for c in cards if c.rank != 2]
 
+# One immutable result per category, so evaluation never allocates
+_RESULTS: Tuple[EvalResult, ...] = tuple(EvalResult(name, code) for code, name in enumerate(CATEGORY_NAMES))
 
-def _rank_counts(naturals: Sequence[Card]) -> Dict[int, int]:
-    d: Dict[int, int] = {}
-    for c in naturals:
-        d[c.rank] = d.get(c.rank, 0) + 1
-    return d
 
-
-def _all_naturals_same_suit(naturals: Sequence[Card]) -> bool:
-    if not naturals:
-        return True  # all wilds can choose a suit
-    s = naturals[0].suit
-    return all(c.suit == s for c in naturals)
-
-
-def _can_make_sequence(naturals: Sequence[Card], wilds: int, seq: Tuple[int, ...]) -> bool:
-    natural_ranks = {c.rank for c in naturals}
-    present = sum(1 for r in seq if r in natural_ranks)
-    missing = 5 - present
-    return missing <= wilds
-
-
-def _naturals_rank_mask(naturals: Sequence[Card]) -> int:
-    m = 0
-    for c in naturals:
-        m |= RANK_TO_BIT[c.rank]
-    return m
-
-
-def _can_make_any_straight(naturals: Sequence[Card], wilds: int) -> bool:
-    natural_mask = _naturals_rank_mask(naturals)
-
-    # For each candidate straight, count how many ranks are missing among naturals.
-    for straight_mask in STRAIGHT_SEQ_MASKS:
-        missing = (straight_mask & ~natural_mask).bit_count()
-        if missing <= wilds:
-            return True
-
-    return False
-
-def _can_make_royal(naturals: Sequence[Card], wilds: int) -> bool:
-    return _can_make_sequence(naturals, wilds, ROYAL_SEQ)
+ACE_MASK = 0x1000_1000_1000_1000  # the ace bit of every suit lane
 
 
 def _can_make_n_of_kind(rc: Dict[int, int], wilds: int, n: int) -> bool:
@@ -131,86 +97,36 @@ def _can_make_n_of_kind(rc: Dict[int, int], wilds: int, n: int) -> bool:
 
 def _can_make_full_house(rc: Dict[int, int], wilds: int) -> bool:
     """
-    Can we allocate wilds to make trips + pair on two different ranks?
-    O(#ranks) approach with no sorting and no nested loops.
+    Trips + pair on two different ranks, wilds filling the gaps. Closed form:
+    the cheapest choice is always trips from the largest natural count and
+    the pair from the second largest (0 if absent; unused ranks are free).
     """
-    # Candidate ranks: naturals plus all non-deuce ranks 3..14
-    candidates = set(rc.keys())
-    candidates.update(range(3, 15))  # 3..14 (A)
-
-    # Compute needs for making a pair for each rank; track best and second best
-    best_r = None
-    best_need = 99
-    second_need = 99
-
-    need2: Dict[int, int] = {}
-    need3: Dict[int, int] = {}
+    a = b = 0  # largest and second-largest natural rank counts
+    for cnt in rc.values():
+        if cnt > a:
+            a, b = cnt, a
+        elif cnt > b:
+            b = cnt
+    return max(0, 3 - a) + max(0, 2 - b) <= wilds
 
-    for r in candidates:
-        cnt = rc.get(r, 0)
 
-        n2 = 2 - cnt
-        n3 = 3 - cnt
-
-        n2 = 0 if n2 < 0 else n2
-        n3 = 0 if n3 < 0 else n3
-
-        need2[r] = n2
-        need3[r] = n3
-
-        if n2 < best_need:
-            second_need = best_need
-            best_need = n2
-            best_r = r
-        elif n2 < second_need:
-            second_need = n2
-
-    # If we can't even form any pair rank at all (shouldn't happen), bail
-    if best_r is None:
-        return False
-
-    # For each trips rank, see if there's a pair rank (different) that fits
-    for r3 in candidates:
-        w_after = wilds - need3[r3]
-        if w_after < 0:
-            continue
-
-        pair_need = best_need if r3 != best_r else second_need
-        if pair_need <= w_after:
-            return True
-
-    return False
-
-
-def _is_natural_royal_flush(naturals: Sequence[Card], wilds: int) -> bool:
-    if wilds != 0:
-        return False
-    if len(naturals) != 5:
-        return False
-    if not _all_naturals_same_suit(naturals):
-        return False
-    ranks = sorted({c.rank for c in naturals})
-    return tuple(ranks) == ROYAL_SEQ
-
-
-def _four_deuces_category(cards: Sequence[Card], wilds: int) -> str | None:
+def _four_deuces_category(nat64: int, wilds: int) -> int | None:
     if wilds != 4:
         return None
     # Exactly one natural remains; kicker matters in this bonus variant
-    natural = next((c for c in cards if c.rank != 2), None)
-    if natural and natural.rank == 14:
-        return FOUR_DEUCES_WITH_ACE
-    return FOUR_DEUCES
+    if nat64 & ACE_MASK:
+        return CODE_FOUR_DEUCES_WITH_ACE
+    return CODE_FOUR_DEUCES
 
 
-def _five_kind_category(rc: Dict[int, int], wilds: int) -> str | None:
+def _five_kind_category(rc: Dict[int, int], wilds: int) -> int | None:
     """
     Deuces Wild Bonus splits 5-of-a-kind payouts:
       - five_aces
       - five_345
       - five_6_to_k
 
-    We return the best *payout class* available.
+    We return the code of the best *payout class* available.
     Requires wilds > 0 in DW.
     """
     if wilds <= 0:
@@ -218,28 +134,30 @@ def _five_kind_category(rc: Dict[int, int], wilds: int) -> str | None:
 
     # Prefer in payout order: A > 3/4/5 > 6..K
     if rc.get(14, 0) + wilds >= 5:
-        return FIVE_ACES
+        return CODE_FIVE_ACES
 
     for r in (3, 4, 5):
         if rc.get(r, 0) + wilds >= 5:
-            return FIVE_345
+            return CODE_FIVE_345
 
     for r in range(6, 14):  # 6..13 (K)
         if rc.get(r, 0) + wilds >= 5:
-            return FIVE_6_TO_K
+            return CODE_FIVE_6_TO_K
 
     # If no naturals at all, wilds alone can form five-of-a-kind of any rank.
     # With <=4 wilds, you still need at least one natural to reach 5 cards total,
     # so this generally won't trigger; keep it as a safe fallback.
     if not rc and wilds >= 5:
-        return FIVE_ACES
+        return CODE_FIVE_ACES
 
     return None
 
 
-def evaluate_deuces_bonus(cards: Sequence[Card]) -> EvalResult:
+def _evaluate_deuces_bonus_code(cards: Sequence[Card]) -> int:
     """
-    Deuces Wild Bonus evaluator (IGT-style category granularity).
+    Reference Deuces Wild Bonus cascade (IGT-style category granularity);
+    returns a category code. Fills the lookup tables behind
+    evaluate_deuces_bonus.
 
     Ranking order (matches common DW Bonus paytables):
       natural_royal_flush
@@ -257,52 +175,89 @@ def evaluate_deuces_bonus(cards: Sequence[Card]) -> EvalResult:
       three_of_a_kind
       nothing
     """
-    if len(cards) != 5:
-        raise ValueError("evaluate_deuces_bonus expects exactly 5 cards")
+    wilds, nat64, rc = _summarize(cards)
+    ranks_any = _ranks_any(nat64)
 
-    wilds = _count_deuces(cards)
-    naturals = _naturals(cards)
-    rc = _rank_counts(naturals)
+    # Shared by several categories below: compute once. A straight needs five
+    # distinct ranks, so paired naturals skip the straight-mask scan entirely.
+    same_suit = _all_naturals_same_suit(nat64)
+    straight = ranks_any.bit_count() + wilds == 5 and _can_make_any_straight(ranks_any, wilds)
 
     # --- Top hands ---
-    if _is_natural_royal_flush(naturals, wilds):
-        return EvalResult(NATURAL_ROYAL_FLUSH)
+    if wilds == 0 and same_suit and ranks_any == ROYAL_MASK:
+        return CODE_NATURAL_ROYAL_FLUSH
 
-    four_deuces_cat = _four_deuces_category(cards, wilds)
-    if four_deuces_cat:
-        return EvalResult(four_deuces_cat)
+    four_deuces_cat = _four_deuces_category(nat64, wilds)
+    if four_deuces_cat is not None:
+        return four_deuces_cat
 
     # Wild royal flush (royal w/ >=1 deuce; suited naturals; ranks can be completed by wilds)
-    if wilds > 0 and _all_naturals_same_suit(naturals) and _can_make_royal(naturals, wilds):
-        return EvalResult(WILD_ROYAL_FLUSH)
+    if wilds > 0 and same_suit and _can_make_royal(ranks_any, wilds):
+        return CODE_WILD_ROYAL_FLUSH
 
     five_cat = _five_kind_category(rc, wilds)
-    if five_cat:
-        return EvalResult(five_cat)
+    if five_cat is not None:
+        return five_cat
 
     # Straight flush (including wheel), if naturals can be made into a straight and all suited
-    if _all_naturals_same_suit(naturals) and _can_make_any_straight(naturals, wilds):
-        return EvalResult(STRAIGHT_FLUSH)
+    if same_suit and straight:
+        return CODE_STRAIGHT_FLUSH
 
     # Four of a kind (any rank, including via wilds)
     if _can_make_n_of_kind(rc, wilds, 4):
-        return EvalResult(FOUR_OF_A_KIND)
+        return CODE_FOUR_OF_A_KIND
 
     # Full house
     if _can_make_full_house(rc, wilds):
-        return EvalResult(FULL_HOUSE)
+        return CODE_FULL_HOUSE
 
     # Flush
-    if _all_naturals_same_suit(naturals):
-        return EvalResult(FLUSH)
+    if same_suit:
+        return CODE_FLUSH
 
     # Straight
-    if _can_make_any_straight(naturals, wilds):
-        return EvalResult(STRAIGHT)
+    if straight:
+        return CODE_STRAIGHT
 
     # Three of a kind
     if _can_make_n_of_kind(rc, wilds, 3):
-        return EvalResult(THREE_OF_A_KIND)
+        return CODE_THREE_OF_A_KIND
+
+    return CODE_NOTHING
+
 
-    return EvalResult(NOTHING)
+# Category code per rank multiset (the product of the cards' Card.prime),
+# split by whether the naturals share a suit; each of the few thousand
+# classes is classified by _evaluate_deuces_bonus_code the first time it is seen.
+_MIXED_LUT: Dict[int, int] = {}
+_SUITED_LUT: Dict[int, int] = {}
 
+
+def evaluate_deuces_bonus_category(cards: Sequence[Card]) -> int:
+    """
+    Deuces Wild Bonus category code for 5 Cards; see
+    _evaluate_deuces_bonus_code for the ranking order. One table load keyed
+    by the cards' prime product, picked by whether the naturals share a suit
+    (the four-deuces kicker and five-of-a-kind rank are part of the multiset).
+    """
+    if len(cards) != 5:
+        raise ValueError("evaluate_deuces_bonus expects exactly 5 cards")
+
+    c0, c1, c2, c3, c4 = cards
+    hand64 = c0.bit | c1.bit | c2.bit | c3.bit | c4.bit
+    nat64 = hand64 & ~DEUCE_MASK
+    lut = _SUITED_LUT if _all_naturals_same_suit(nat64) else _MIXED_LUT
+    key = c0.prime * c1.prime * c2.prime * c3.prime * c4.prime
+    code = lut.get(key)
+    if code is None:
+        code = _evaluate_deuces_bonus_code(cards)
+        # Only a hand of 5 distinct cards may fill its class: one with a
+        # repeated card is misread off the bitboard, and would poison the table
+        if hand64.bit_count() == 5:
+            lut[key] = code
+    return code
+
+
+def evaluate_deuces_bonus(cards: Sequence[Card]) -> EvalResult:
+    """Deuces Wild Bonus evaluator; evaluate_deuces_bonus_category wrapped in its EvalResult."""
+    return _RESULTS[evaluate_deuces_bonus_category(cards)]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+
+from . import hand_eval_deuces as _dw
+from . import hand_eval_deuces_bonus as _dwb
+
+_RANK_BITS = 1 << np.arange(13)  # rank index (rank - 2) -> bit, as in the bitboard lanes
+
+# (10, 13) 0/1: ranks of each straight window (STRAIGHT_MASKS order; last row is the royal)
+_STRAIGHT_RANKS = ((np.array(_dw.STRAIGHT_MASKS)[:, None] & _RANK_BITS) != 0).astype(np.int8)
+_HIST_SHIFTS = 3 * np.arange(13)  # rank index -> its 3-bit slot in a packed histogram
+_IDX_A = 12
+_IDX_5 = 3
+
+
+def _features(cards: np.ndarray):
+    """
+    Per-hand wild count, natural rank counts, suitedness and straight flags.
+
+    Works on the rank and suit planes of the (N, 5) cards: each hand's
+    natural rank histogram is packed into one int64 (3 bits per rank) and
+    its natural suits into a 4-bit set, so nothing is (N, 5, 13) wide.
+    """
+    ranks = (cards >> 2).astype(np.int64)
+    wild = ranks == 0
+    wilds = wild.sum(axis=1)
+
+    hist = np.where(wild, 0, 1 << (3 * ranks)).sum(axis=1)
+    counts = (hist[:, None] >> _HIST_SHIFTS) & 7  # (N, 13) natural rank counts
+    top2 = np.partition(counts, -2, axis=1)
+    b, a = top2[:, -2], top2[:, -1]
+
+    suit_bits = np.bitwise_or.reduce(np.where(wild, 0, 1 << (cards & 3).astype(np.int64)), axis=1)
+    same_suit = (suit_bits & (suit_bits - 1)) == 0
+
+    present = (counts > 0).astype(np.int8)
+    missing = 5 - present @ _STRAIGHT_RANKS.T  # (N, 10)
+    distinct = present.sum(axis=1) + wilds == 5
+    straight = distinct & (missing <= wilds[:, None]).any(axis=1)
+    royal_missing = missing[:, -1]
+    return wilds, counts, a, b, same_suit, straight, royal_missing
+
+
+def _select(conds_choices, default: int) -> np.ndarray:
+    conds, choices = zip(*conds_choices)
+    return np.select(conds, choices, default).astype(np.int8)
+
+
+def evaluate_deuces_codes_np(cards: np.ndarray) -> np.ndarray:
+    """
+    Vectorized evaluate_deuces: (N, 5) packed-int cards -> (N,) category
+    codes (index hand_eval_deuces.CATEGORY_NAMES). Same precedence cascade,
+    as one np.select over column-wise flags.
+    """
+    wilds, counts, a, b, same_suit, straight, royal_missing = _features(cards)
+    hit = wilds > 0
+    return _select(
+        [
+            ((wilds == 0) & same_suit & (royal_missing == 0), _dw.CODE_NATURAL_ROYAL_FLUSH),
+            (wilds == 4, _dw.CODE_FOUR_DEUCES),
+            (hit & same_suit & (royal_missing <= wilds), _dw.CODE_WILD_ROYAL_FLUSH),
+            (hit & (a + wilds >= 5), _dw.CODE_FIVE_OF_A_KIND),
+            (same_suit & straight, _dw.CODE_STRAIGHT_FLUSH),
+            (a + wilds >= 4, _dw.CODE_FOUR_OF_A_KIND),
+            (np.maximum(0, 3 - a) + np.maximum(0, 2 - b) <= wilds, _dw.CODE_FULL_HOUSE),
+            (same_suit, _dw.CODE_FLUSH),
+            (straight, _dw.CODE_STRAIGHT),
+            (a + wilds >= 3, _dw.CODE_THREE_OF_A_KIND),
+        ],
+        _dw.CODE_NOTHING,
+    )
+
+
+def evaluate_deuces_bonus_codes_np(cards: np.ndarray) -> np.ndarray:
+    """Vectorized evaluate_deuces_bonus (codes index hand_eval_deuces_bonus.CATEGORY_NAMES)."""
+    wilds, counts, a, b, same_suit, straight, royal_missing = _features(cards)
+    hit = wilds > 0
+    five = hit & (a + wilds >= 5)
+    five_rank = counts.argmax(axis=1)  # unique with 1-3 wilds
+    return _select(
+        [
+            ((wilds == 0) & same_suit & (royal_missing == 0), _dwb.CODE_NATURAL_ROYAL_FLUSH),
+            ((wilds == 4) & (counts[:, _IDX_A] > 0), _dwb.CODE_FOUR_DEUCES_WITH_ACE),
+            (wilds == 4, _dwb.CODE_FOUR_DEUCES),
+            (hit & same_suit & (royal_missing <= wilds), _dwb.CODE_WILD_ROYAL_FLUSH),
+            (five & (five_rank == _IDX_A), _dwb.CODE_FIVE_ACES),
+            (five & (five_rank <= _IDX_5), _dwb.CODE_FIVE_345),
+            (five, _dwb.CODE_FIVE_6_TO_K),
+            (same_suit & straight, _dwb.CODE_STRAIGHT_FLUSH),
+            (a + wilds >= 4, _dwb.CODE_FOUR_OF_A_KIND),
+            (np.maximum(0, 3 - a) + np.maximum(0, 2 - b) <= wilds, _dwb.CODE_FULL_HOUSE),
+            (same_suit, _dwb.CODE_FLUSH),
+            (straight, _dwb.CODE_STRAIGHT),
+            (a + wilds >= 3, _dwb.CODE_THREE_OF_A_KIND),
+        ],
+        _dwb.CODE_NOTHING,
+    )
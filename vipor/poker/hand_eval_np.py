@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import numpy as np
+
+from .hand_eval import (
+    CODE_FLUSH,
+    CODE_FOUR,
+    CODE_FOUR_234,
+    CODE_FOUR_ACES,
+    CODE_FOUR_ACES_234,
+    CODE_FOUR_LOW_ACE,
+    CODE_FULL_HOUSE,
+    CODE_JOB,
+    CODE_ROYAL_FLUSH,
+    CODE_STRAIGHT,
+    CODE_STRAIGHT_FLUSH,
+    CODE_THREE,
+    CODE_TWO_PAIR,
+)
+
+# Rank *indices* (rank - 2) as stored in packed cards (c >> 2)
+_IDX_5 = 3
+_IDX_T = 8
+_IDX_J = 9
+_IDX_4 = 2
+_IDX_A = 12
+
+
+def evaluate_codes_np(cards: np.ndarray) -> np.ndarray:
+    """
+    Vectorized JoB evaluator: (N, 5) packed-int cards -> (N,) category codes.
+
+    Same classification as hand_eval._evaluate_five_int, done column-wise on
+    the row-sorted ranks (adjacent-equality flags), with no per-hand Python.
+    """
+    ranks = np.sort(cards >> 2, axis=1)
+    suits = cards & 3
+    r0, r1, r2, r3, r4 = ranks.T
+
+    e01 = r0 == r1
+    e12 = r1 == r2
+    e23 = r2 == r3
+    e34 = r3 == r4
+    pair_count = e01.astype(np.int8) + e12 + e23 + e34
+
+    codes = np.zeros(len(cards), dtype=np.int8)  # CODE_NOTHING
+
+    # 5 distinct ranks: flush / straight / straight flush
+    distinct = pair_count == 0
+    straight = distinct & ((r4 - r0 == 4) | ((r3 == _IDX_5) & (r4 == _IDX_A)))
+    flush = (suits == suits[:, :1]).all(axis=1)
+    codes[straight] = CODE_STRAIGHT
+    codes[flush] = CODE_FLUSH
+    sf = straight & flush
+    codes[sf] = np.where(r0[sf] == _IDX_T, CODE_ROYAL_FLUSH, CODE_STRAIGHT_FLUSH)
+
+    # One pair: r1 or r3 is always part of it
+    one = pair_count == 1
+    pair_rank = np.where(e01 | e12, r1, r3)
+    codes[one & (pair_rank >= _IDX_J)] = CODE_JOB
+
+    # Two pair vs trips
+    two = pair_count == 2
+    trips = (e01 & e12) | (e12 & e23) | (e23 & e34)
+    codes[two] = np.where(trips[two], CODE_THREE, CODE_TWO_PAIR)
+
+    # Full house vs quads (quads at 0..3 with kicker r4, or 1..4 with kicker r0)
+    three = pair_count == 3
+    quads = three & e12 & e23
+    codes[three & ~quads] = CODE_FULL_HOUSE
+    if quads.any():
+        quad_rank = np.where(e01, r0, r4)[quads]
+        kicker = np.where(e01, r4, r0)[quads]
+        low_kicker = kicker <= _IDX_4
+        q = np.full(len(quad_rank), CODE_FOUR, dtype=np.int8)
+        aces = quad_rank == _IDX_A
+        q[aces] = np.where(low_kicker[aces], CODE_FOUR_ACES_234, CODE_FOUR_ACES)
+        low = quad_rank <= _IDX_4
+        q[low] = np.where(low_kicker[low] | (kicker[low] == _IDX_A), CODE_FOUR_LOW_ACE, CODE_FOUR_234)
+        codes[quads] = q
+
+    return codes
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class HoldDecision:
+    mask: int  # 5-bit hold mask; bit i set => hold card i
+
+
+# One interned decision per mask, for strategies that only compute the mask
+HOLD_DECISIONS: Tuple[HoldDecision, ...] = tuple(HoldDecision(mask=m) for m in range(32))
@@ -24,17 +24,25 @@ class HotRollState:
     multiplier: Optional[int] = None
 
 
+# Returned for the (common) no-roll hand. Shared: callers must not mutate it;
+# maybe_trigger_hot_roll never does, since nothing is scheduled.
+_NO_ROLL_STATE = HotRollState()
+
+
 def schedule_hot_roll_for_hand(rng: random.Random, cfg: HotRollConfig) -> HotRollState:
     """
     Decide at the start of a hand whether Hot Roll will occur this hand.
     If yes, decide whether it triggers on deal or draw.
+
+    One uniform draw decides both: given a roll, u is uniform on
+    [0, p_per_hand), so u < p_per_hand * p_deal_given_roll picks the deal.
     """
-    st = HotRollState()
-    if rng.random() >= cfg.p_per_hand:
-        return st
+    u = rng.random()
+    if u >= cfg.p_per_hand:
+        return _NO_ROLL_STATE
 
-    st.scheduled_phase = "deal" if (rng.random() < cfg.p_deal_given_roll) else "draw"
-    return st
+    phase: Phase = "deal" if u < cfg.p_per_hand * cfg.p_deal_given_roll else "draw"
+    return HotRollState(scheduled_phase=phase)
 
 
 def maybe_trigger_hot_roll(rng: random.Random, st: HotRollState, phase: Phase) -> Optional[int]:
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Sequence, Tuple
 
 import yaml
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @dataclass(frozen=True, slots=True)
 class PayTable:
     name: str
     bet_unit: int
     payouts: Dict[str, int]
+    # payout_array results per category-name tuple (the hot loops' lookup)
+    _arrays: Dict[Tuple[str, ...], np.ndarray] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @classmethod
     def from_yaml(cls, path: str) -> "PayTable":
@@ -34,5 +39,24 @@ class PayTable:
         return cls(name=name, bet_unit=bet_unit, payouts=payouts)
 
     def payout_for(self, category: str) -> int:
-        return int(self.payouts.get(category, 0))
-
+        return self.payouts.get(category, 0)  # values are validated ints
+
+    def payout_tuple(self, categories: Sequence[str]) -> Tuple[int, ...]:
+        """Payouts laid out by category code (categories[code] is the name), for hot loops."""
+        return tuple(self.payout_for(cat) for cat in categories)
+
+    def payout_array(self, categories: Sequence[str]) -> np.ndarray:
+        """
+        payout_tuple as a read-only int64 array, for the array backends
+        (payout_array(names)[codes]); built once per category set. numpy is
+        only imported here, so the pure-Python paths never load it.
+        """
+        import numpy as np
+
+        key = tuple(categories)
+        arr = self._arrays.get(key)
+        if arr is None:
+            arr = np.asarray(self.payout_tuple(key), dtype=np.int64)
+            arr.flags.writeable = False
+            self._arrays[key] = arr
+        return arr
@@ -1,15 +1,106 @@
 from __future__ import annotations
 
 import random
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, Dict, List, Optional
 
 from .cards import Card
 from .deck import Deck
 from .paytable import PayTable
-from .strategy import HoldDecision, hold_any_pair_else_none
+from .strategy import (
+    MASK_FNS,
+    STRATEGY_FN_TABLE,
+    HoldDecision,
+    hold_all,
+    hold_any_pair_else_none,
+    hold_job_pair_else_none,
+    hold_nothing,
+)
+from . import hand_eval, hand_eval_deuces, hand_eval_deuces_bonus
 from .hand_eval import evaluate_hand as default_evaluate_hand
 
+# Built-in evaluators -> (Cards -> category code twin, the names those codes index)
+_CODE_EVALUATORS: Dict[Callable, tuple] = {
+    default_evaluate_hand: (hand_eval.evaluate_hand_category, hand_eval.CATEGORY_NAMES),
+    hand_eval_deuces.evaluate_deuces: (
+        hand_eval_deuces.evaluate_deuces_category,
+        hand_eval_deuces.CATEGORY_NAMES,
+    ),
+    hand_eval_deuces_bonus.evaluate_deuces_bonus: (
+        hand_eval_deuces_bonus.evaluate_deuces_bonus_category,
+        hand_eval_deuces_bonus.CATEGORY_NAMES,
+    ),
+}
+
+# The Numba kernel and the NumPy batch backends (and numpy/numba themselves)
+# are imported at dispatch, the first time a run can use them, so importing
+# sim stays cheap.
+
+
+@lru_cache(maxsize=None)
+def _kernel_backend():
+    """
+    (_sim_numba, strategy fn -> kernel id, evaluator -> (kernel id, names)),
+    or None without numba.
+    """
+    try:
+        from . import _sim_numba
+    except ImportError:
+        return None
+    strategies: Dict[Callable, int] = {
+        hold_nothing: _sim_numba.HOLD_NOTHING,
+        hold_all: _sim_numba.HOLD_ALL,
+        hold_any_pair_else_none: _sim_numba.HOLD_ANY_PAIR,
+        hold_job_pair_else_none: _sim_numba.HOLD_JOB_PAIR,
+    }
+    evaluators: Dict[Callable, tuple] = {
+        default_evaluate_hand: (_sim_numba.EVAL_JOB, hand_eval.CATEGORY_NAMES),
+        hand_eval_deuces.evaluate_deuces: (_sim_numba.EVAL_DEUCES, hand_eval_deuces.CATEGORY_NAMES),
+        hand_eval_deuces_bonus.evaluate_deuces_bonus: (
+            _sim_numba.EVAL_DEUCES_BONUS,
+            hand_eval_deuces_bonus.CATEGORY_NAMES,
+        ),
+    }
+    return _sim_numba, strategies, evaluators
+
+
+@lru_cache(maxsize=None)
+def _vector_backend():
+    """
+    (_sim_np, strategy fn -> vectorized twin, evaluator -> (vectorized twin,
+    names)); the twins take (N, 5) packed ints and return (N,) masks / codes.
+    """
+    from . import _sim_np
+    from .hand_eval_deuces_np import evaluate_deuces_bonus_codes_np, evaluate_deuces_codes_np
+    from .hand_eval_np import evaluate_codes_np
+    from .strategy_rules_riff import riff_strategy, riff_strategy_batch
+
+    strategies: Dict[Callable, Callable] = {
+        hold_nothing: _sim_np.hold_nothing_np,
+        hold_all: _sim_np.hold_all_np,
+        hold_any_pair_else_none: _sim_np.hold_any_pair_else_none_np,
+        hold_job_pair_else_none: _sim_np.hold_job_pair_else_none_np,
+        riff_strategy: riff_strategy_batch,
+    }
+    evaluators: Dict[Callable, tuple] = {
+        default_evaluate_hand: (evaluate_codes_np, hand_eval.CATEGORY_NAMES),
+        hand_eval_deuces.evaluate_deuces: (evaluate_deuces_codes_np, hand_eval_deuces.CATEGORY_NAMES),
+        hand_eval_deuces_bonus.evaluate_deuces_bonus: (
+            evaluate_deuces_bonus_codes_np,
+            hand_eval_deuces_bonus.CATEGORY_NAMES,
+        ),
+    }
+    return _sim_np, strategies, evaluators
+
+
+def _is_riff_strategy(strategy_fn: Callable) -> bool:
+    # Anyone holding riff_strategy has imported its module, so there is
+    # nothing to import just to ask
+    riff = sys.modules.get(f"{__package__}.strategy_rules_riff")
+    return riff is not None and strategy_fn is riff.riff_strategy
+
 
 @dataclass
 class SimResult:
@@ -30,37 +121,100 @@ def simulate(
     trace_n: int = 0,
     strategy_fn: Callable[[List[Card]], HoldDecision] = hold_any_pair_else_none,
     evaluator: Callable[[List[Card]], object] = default_evaluate_hand,
+    strategy_id: Optional[int] = None,
 ) -> SimResult:
+    """
+    Play `hands` hands of `strategy_fn` and tally payouts by category.
+    `strategy_id` (strategy.STRATEGY_NAME_TO_ID) selects a registered
+    strategy instead, and takes precedence over `strategy_fn`.
+
+    Simple strategies (strategy.py) with a built-in evaluator run in the
+    Numba kernel when numba is installed, else as NumPy batches (same
+    distribution, different random stream than the Python loop); so does
+    riff_strategy, via riff_strategy_batch. Anything else uses the loop
+    below.
+    """
+    if strategy_id is not None:
+        strategy_fn = STRATEGY_FN_TABLE[strategy_id]
+
+    builtin_eval = evaluator in _CODE_EVALUATORS
+    simple = strategy_fn in MASK_FNS  # exactly the strategies with kernel twins
+
+    kernel = _kernel_backend() if simple and builtin_eval else None
+    if kernel is not None:
+        _sim_numba, kernel_strategies, kernel_evaluators = kernel
+        evaluator_id, names = kernel_evaluators[evaluator]
+        counts, total_unit = _sim_numba.simulate_kernel(
+            paytable.payout_array(names),
+            hands,
+            seed,
+            kernel_strategies[strategy_fn],
+            evaluator_id,
+        )
+        category_counts = {names[code]: int(n) for code, n in enumerate(counts) if n}
+        return _result(hands, bet_per_hand, int(total_unit) * bet_per_hand, category_counts)
+
+    if builtin_eval and (simple or _is_riff_strategy(strategy_fn)):
+        _sim_np, vector_strategies, vector_evaluators = _vector_backend()
+        eval_np, names = vector_evaluators[evaluator]
+        category_counts, total_unit = _sim_np.simulate_batched(
+            paytable.payout_array(names),
+            hands,
+            seed,
+            vector_strategies[strategy_fn],
+            eval_np,
+            names,
+        )
+        return _result(hands, bet_per_hand, total_unit * bet_per_hand, category_counts)
+
     rng = random.Random(seed)
     deck = Deck(rng=rng)
 
-    total_bet = hands * bet_per_hand
-    total_payout = 0
+    # Built-in strategies / evaluators run as their int-returning twins and
+    # are tallied by category code; others go through their result objects.
+    mask_fn = MASK_FNS.get(strategy_fn)
+    code_eval = _CODE_EVALUATORS.get(evaluator)
+    names = None
+    if code_eval is not None:
+        code_fn, names = code_eval
+        pay_by_code = paytable.payout_tuple(names)
+        counts = [0] * len(names)
+
+    total_unit = 0
     category_counts: Dict[str, int] = {}
 
     for h in range(hands):
         deck.reset()
         init = deck.deal(5)
 
-        decision = strategy_fn(init)
-        mask = decision.mask
+        mask = mask_fn(init) if mask_fn is not None else strategy_fn(init).mask
 
         final = init[:]
         for i in range(5):
             if not (mask & (1 << i)):
                 final[i] = deck.draw()
 
-        # evaluator returns either EvalResult(category=...) or something with .category
-        ev = evaluator(final)
-        cat = ev.category  # both JoB and Deuces evaluators use this
-
-        category_counts[cat] = category_counts.get(cat, 0) + 1
-        total_payout += paytable.payout_for(cat) * bet_per_hand
+        if names is not None:
+            code = code_fn(final)
+            counts[code] += 1
+            total_unit += pay_by_code[code]
+        else:
+            # evaluator returns EvalResult(category=...) or something with .category
+            cat = evaluator(final).category
+            category_counts[cat] = category_counts.get(cat, 0) + 1
+            total_unit += paytable.payout_for(cat)
 
         if h < trace_n:
             # Optional: keep your existing trace format if you like
             pass
 
+    if names is not None:
+        category_counts = {names[code]: n for code, n in enumerate(counts) if n}
+    return _result(hands, bet_per_hand, total_unit * bet_per_hand, category_counts)
+
+
+def _result(hands: int, bet_per_hand: int, total_payout: int, category_counts: Dict[str, int]) -> SimResult:
+    total_bet = hands * bet_per_hand
     total_net = total_payout - total_bet
     ev_per_hand = total_net / hands if hands else 0.0
     return_pct = total_payout / total_bet if total_bet else 0.0
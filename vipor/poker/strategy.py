@@ -1,49 +1,93 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Optional
 
 from .cards import Card
-from .hold import HoldDecision
+from .hold import HOLD_DECISIONS, HoldDecision
 from .strategy_rules_j_riff import j_riff_strategy_deuces_wild_bonus
 
 
 StrategyFn = Callable[[List[Card]], HoldDecision]
 
+def _pair_hold_lut(min_rank: int) -> bytes:
+    """
+    Hold masks of "hold every card of a pair of rank >= min_rank" for all
+    13**5 rank sequences: byte ((((r0*13 + r1)*13 + r2)*13 + r3)*13 + r4)
+    with r = rank - 2, in hand order.
+    """
+    import numpy as np
+
+    r = np.ix_(*[np.arange(13, dtype=np.int8)] * 5)  # rank index of card i, along axis i
+    lut = np.zeros((13,) * 5, dtype=np.uint8)
+    for i in range(5):
+        paired = np.zeros((13,) * 5, dtype=bool)
+        for j in range(5):
+            if j != i:
+                paired |= r[i] == r[j]
+        lut |= (paired & (r[i] >= min_rank - 2)).astype(np.uint8) << i
+    return lut.tobytes()
+
+
+# The pair holds only depend on the rank sequence, so they are one table
+# load. The tables (371 KB each, built with numpy) are made on first use,
+# so importing the strategies stays cheap.
+_ANY_PAIR_LUT: Optional[bytes] = None
+_JOB_PAIR_LUT: Optional[bytes] = None
+
+
+def _build_pair_luts() -> None:
+    global _ANY_PAIR_LUT, _JOB_PAIR_LUT
+    _ANY_PAIR_LUT = _pair_hold_lut(2)
+    _JOB_PAIR_LUT = _pair_hold_lut(11)
+
+
+def _rank_seq_key(cards: List[Card]) -> int:
+    c0, c1, c2, c3, c4 = cards
+    return ((((c0.rank - 2) * 13 + c1.rank - 2) * 13 + c2.rank - 2) * 13 + c3.rank - 2) * 13 + c4.rank - 2
+
+MaskFn = Callable[[List[Card]], int]
+
+# Mask-only twins of the simple strategies, for loops that never need the
+# HoldDecision itself
+def hold_nothing_mask(_cards: List[Card]) -> int:
+    return 0
+
+def hold_all_mask(_cards: List[Card]) -> int:
+    return 31
+
+def hold_any_pair_else_none_mask(cards: List[Card]) -> int:
+    if _ANY_PAIR_LUT is None:
+        _build_pair_luts()
+    return _ANY_PAIR_LUT[_rank_seq_key(cards)]
+
+def hold_job_pair_else_none_mask(cards: List[Card]) -> int:
+    if _JOB_PAIR_LUT is None:
+        _build_pair_luts()
+    return _JOB_PAIR_LUT[_rank_seq_key(cards)]
+
 def hold_nothing(_cards: List[Card]) -> HoldDecision:
-    return HoldDecision(mask=0)
+    return HOLD_DECISIONS[0]
 
 def hold_all(_cards: List[Card]) -> HoldDecision:
-    return HoldDecision(mask=31)
+    return HOLD_DECISIONS[31]
 
 def hold_any_pair_else_none(cards: List[Card]) -> HoldDecision:
-    counts: Dict[int, int] = {}
-    for c in cards:
-        counts[c.rank] = counts.get(c.rank, 0) + 1
-
-    pair_ranks = {r for r, n in counts.items() if n >= 2}
-    if not pair_ranks:
-        return HoldDecision(mask=0)
-
-    mask = 0
-    for i, c in enumerate(cards):
-        if c.rank in pair_ranks:
-            mask |= (1 << i)
-    return HoldDecision(mask=mask)
+    if _ANY_PAIR_LUT is None:
+        _build_pair_luts()
+    return HOLD_DECISIONS[_ANY_PAIR_LUT[_rank_seq_key(cards)]]
 
 def hold_job_pair_else_none(cards: List[Card]) -> HoldDecision:
-    counts: Dict[int, int] = {}
-    for c in cards:
-        counts[c.rank] = counts.get(c.rank, 0) + 1
-
-    high_pair_ranks = {r for r, n in counts.items() if n >= 2 and r >= 11}
-    if not high_pair_ranks:
-        return HoldDecision(mask=0)
+    if _JOB_PAIR_LUT is None:
+        _build_pair_luts()
+    return HOLD_DECISIONS[_JOB_PAIR_LUT[_rank_seq_key(cards)]]
 
-    mask = 0
-    for i, c in enumerate(cards):
-        if c.rank in high_pair_ranks:
-            mask |= (1 << i)
-    return HoldDecision(mask=mask)
+# strategy fn -> its mask-only twin (parallel to STRATEGY_REGISTRY)
+MASK_FNS: Dict[StrategyFn, MaskFn] = {
+    hold_nothing: hold_nothing_mask,
+    hold_all: hold_all_mask,
+    hold_any_pair_else_none: hold_any_pair_else_none_mask,
+    hold_job_pair_else_none: hold_job_pair_else_none_mask,
+}
 
 STRATEGY_REGISTRY: Dict[str, StrategyFn] = {
     "none": hold_nothing,
@@ -53,10 +97,7 @@ STRATEGY_REGISTRY: Dict[str, StrategyFn] = {
     "j_riff_deuces_bonus": j_riff_strategy_deuces_wild_bonus,
 }
 
-# Optional strategies (do not let them break imports)
-try:
-    from .strategy_rules_j_riff import j_riff_strategy_deuces_wild_bonus
-    STRATEGY_REGISTRY["j_riff_deuces_bonus"] = j_riff_strategy_deuces_wild_bonus
-except Exception:
-    pass
-
+# Dense strategy ids (registry order): STRATEGY_FN_TABLE[id] is the strategy,
+# and the simulate() kernel dispatches on the same ids.
+STRATEGY_FN_TABLE: List[StrategyFn] = list(STRATEGY_REGISTRY.values())
+STRATEGY_NAME_TO_ID: Dict[str, int] = {name: i for i, name in enumerate(STRATEGY_REGISTRY)}
@@ -1,25 +1,106 @@
 from __future__ import annotations
 
 from collections import Counter
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 from .cards import Card
 
 # Ranks: 2..14 where 11=J,12=Q,13=K,14=A
 ROYAL_RANKS = {10, 11, 12, 13, 14}
 
+# Suit -> slot in HandBits.suit_pos. Alphabetical, so "lowest
+# slot wins" is the suit-string tie-break the helpers below document.
+SUIT_IDX: Dict[str, int] = {"C": 0, "D": 1, "H": 2, "S": 3}
+SUIT_BY_IDX: Tuple[str, ...] = ("C", "D", "H", "S")
+
+
+# ----------------------------
+# One-pass hand decode
+# ----------------------------
+
+class HandBits(NamedTuple):
+    """
+    Bitmask view of a hand, built once by decode().
+
+    rank_mask: bit r set for every rank r (2..14) present
+    rank_pos:  per rank (index 2..14), bit i set when cards[i] has that rank
+    suit_pos:  per suit (SUIT_IDX order), bit i set when cards[i] has that suit
+
+    A rank's count is rank_pos[r].bit_count(); its card indices are the set
+    bits of rank_pos[r], in hand order.
+    """
+    rank_mask: int
+    rank_pos: List[int]
+    suit_pos: List[int]
+
+
+def decode(cards: Sequence[Card]) -> HandBits:
+    """Single scan of the hand into the HandBits masks."""
+    rank_mask = 0
+    rank_pos = [0] * 15
+    suit_pos = [0, 0, 0, 0]
+    b = 1
+    for c in cards:
+        r = c.rank
+        rank_mask |= 1 << r
+        rank_pos[r] |= b
+        suit_pos[SUIT_IDX[c.suit]] |= b
+        b <<= 1
+    return HandBits(rank_mask, rank_pos, suit_pos)
+
+
+# Position mask -> its card indices, for hands of up to 7 cards
+_POSITIONS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(i for i in range(7) if m >> i & 1) for m in range(1 << 7)
+)
+
+
+def _positions(pos: int) -> List[int]:
+    """Card indices of the set bits of a position mask (ascending)."""
+    if pos < len(_POSITIONS):
+        return list(_POSITIONS[pos])
+    return [i for i in range(pos.bit_length()) if pos >> i & 1]
+
+
+def _hist(cards: Sequence[Card]) -> bytearray:
+    """Rank histogram: hist[r] = number of cards of rank r (index 2..14)."""
+    hist = bytearray(15)
+    for c in cards:
+        hist[c.rank] += 1
+    return hist
+
+
+def _ranks_with_count(cards: Sequence[Card], bits: Optional[HandBits], n: int) -> List[int]:
+    """Ranks held exactly n times (descending), off `bits` when already decoded."""
+    if bits is not None:
+        rank_pos = bits.rank_pos
+        return [r for r in range(14, 1, -1) if rank_pos[r].bit_count() == n]
+    hist = _hist(cards)
+    return [r for r in range(14, 1, -1) if hist[r] == n]
+
+
+def _rank_indices(cards: Sequence[Card], bits: Optional[HandBits], rank: int) -> List[int]:
+    if bits is not None:
+        return _positions(bits.rank_pos[rank])
+    return [i for i, c in enumerate(cards) if c.rank == rank]
+
 
 # ----------------------------
 # Mask helpers
 # ----------------------------
 
+# Card index -> hold-mask bit; a lookup miss is the out-of-range check
+_BIT: Dict[int, int] = {i: 1 << i for i in range(5)}
+
+
 def mask_from_indices(indices: Sequence[int]) -> int:
     """Build a 5-bit hold mask from card indices (0..4)."""
     mask = 0
-    for i in indices:
-        if i < 0 or i > 4:
-            raise ValueError(f"card index out of range: {i}")
-        mask |= 1 << i
+    try:
+        for i in indices:
+            mask |= _BIT[i]
+    except KeyError as e:
+        raise ValueError(f"card index out of range: {e.args[0]}") from None
     return mask
 
 
@@ -57,8 +138,9 @@ def suits(cards: Sequence[Card]) -> List[str]:
 # Count helpers
 # ----------------------------
 
-def rank_counts(cards: Sequence[Card]) -> Counter:
-    return Counter(c.rank for c in cards)
+def rank_counts(cards: Sequence[Card]) -> bytes:
+    """Rank histogram as 15 bytes: counts[r] for rank r (2..14); 0 when absent."""
+    return bytes(_hist(cards))
 
 
 def suit_counts(cards: Sequence[Card]) -> Counter:
@@ -85,49 +167,43 @@ def groups_by_suit(cards: Sequence[Card]) -> Dict[str, List[int]]:
 # Pair / trips / quads
 # ----------------------------
 
-def pair_ranks(cards: Sequence[Card]) -> List[int]:
+def pair_ranks(cards: Sequence[Card], bits: Optional[HandBits] = None) -> List[int]:
     """All pair ranks present (descending)."""
-    counts = rank_counts(cards)
-    return sorted([r for r, n in counts.items() if n == 2], reverse=True)
+    return _ranks_with_count(cards, bits, 2)
 
 
-def trips_ranks(cards: Sequence[Card]) -> List[int]:
+def trips_ranks(cards: Sequence[Card], bits: Optional[HandBits] = None) -> List[int]:
     """All trips ranks present (descending)."""
-    counts = rank_counts(cards)
-    return sorted([r for r, n in counts.items() if n == 3], reverse=True)
+    return _ranks_with_count(cards, bits, 3)
 
-def quad_indices(cards: Sequence[Card]) -> Optional[List[int]]:
+def quad_indices(cards: Sequence[Card], bits: Optional[HandBits] = None) -> Optional[List[int]]:
     """Return indices of the four-of-a-kind cards if present, else None."""
-    counts = rank_counts(cards)
-    for r, n in counts.items():
-        if n == 4:
-            return [i for i, c in enumerate(cards) if c.rank == r]
+    quads = _ranks_with_count(cards, bits, 4)
+    if quads:
+        return _rank_indices(cards, bits, quads[0])
     return None
 
-def quad_ranks(cards: Sequence[Card]) -> List[int]:
+def quad_ranks(cards: Sequence[Card], bits: Optional[HandBits] = None) -> List[int]:
     """All quad ranks present (descending)."""
-    counts = rank_counts(cards)
-    return sorted([r for r, n in counts.items() if n == 4], reverse=True)
+    return _ranks_with_count(cards, bits, 4)
 
 
-def best_pair_indices(cards: Sequence[Card]) -> Optional[List[int]]:
+def best_pair_indices(cards: Sequence[Card], bits: Optional[HandBits] = None) -> Optional[List[int]]:
     """
     Best (highest) pair indices if any pair exists, else None.
     For two-pair hands, returns the higher pair.
     """
-    pairs = pair_ranks(cards)
+    pairs = _ranks_with_count(cards, bits, 2)
     if not pairs:
         return None
-    target = pairs[0]
-    return indices_of_rank(cards, target)
+    return _rank_indices(cards, bits, pairs[0])
 
 
-def job_pair_indices(cards: Sequence[Card]) -> Optional[List[int]]:
+def job_pair_indices(cards: Sequence[Card], bits: Optional[HandBits] = None) -> Optional[List[int]]:
     """Indices of a Jacks-or-Better pair if present, else None."""
-    pairs = pair_ranks(cards)
-    for r in pairs:
+    for r in _ranks_with_count(cards, bits, 2):
         if r >= 11:
-            return indices_of_rank(cards, r)
+            return _rank_indices(cards, bits, r)
     return None
 
 
@@ -135,42 +211,52 @@ def job_pair_indices(cards: Sequence[Card]) -> Optional[List[int]]:
 # Flush / Royal draw helpers
 # ----------------------------
 
-def n_to_flush(cards: Sequence[Card], n: int) -> Optional[List[int]]:
+def _suit_positions(cards: Sequence[Card], min_rank: int = 2) -> List[int]:
+    """Per-suit (SUIT_IDX order) card-position masks of cards ranked >= min_rank."""
+    suit_pos = [0, 0, 0, 0]
+    b = 1
+    for c in cards:
+        if c.rank >= min_rank:
+            suit_pos[SUIT_IDX[c.suit]] |= b
+        b <<= 1
+    return suit_pos
+
+
+def _best_suit(suit_pos: Sequence[int]) -> int:
+    """Card mask of the fullest suit; ties go to the lower (alphabetical) slot."""
+    counts = [p.bit_count() for p in suit_pos]
+    return suit_pos[counts.index(max(counts))]
+
+
+def n_to_flush(cards: Sequence[Card], n: int, bits: Optional[HandBits] = None) -> Optional[List[int]]:
     """
     Return indices of cards in the best suit if you have at least n of that suit.
     If multiple suits tie, returns one deterministically (max suit count then suit).
     """
     if n <= 0:
         return []
-    sc = suit_counts(cards)
-    if not sc:
-        return None
-    suit, cnt = sorted(sc.items(), key=lambda kv: (-kv[1], kv[0]))[0]
-    if cnt >= n:
-        return indices_of_suit(cards, suit)
+    pos = _best_suit(bits.suit_pos if bits else _suit_positions(cards))
+    if pos and pos.bit_count() >= n:
+        return _positions(pos)
     return None
 
 
-def n_to_royal(cards: Sequence[Card], n: int) -> Optional[List[int]]:
+def n_to_royal(cards: Sequence[Card], n: int, bits: Optional[HandBits] = None) -> Optional[List[int]]:
     """
     Return indices of royal-ranked cards (T,J,Q,K,A) in a single suit if count >= n.
     Chooses the suit with the most royal cards; ties broken deterministically by suit.
     """
     if n <= 0:
         return []
-
-    by_suit: Dict[str, List[int]] = {}
-    for i, c in enumerate(cards):
-        if c.rank in ROYAL_RANKS:
-            by_suit.setdefault(c.suit, []).append(i)
-
-    if not by_suit:
-        return None
-
-    # best = most indices; tie by suit string
-    suit, idx = sorted(by_suit.items(), key=lambda kv: (-len(kv[1]), kv[0]))[0]
-    if len(idx) >= n:
-        return idx
+    if bits:
+        rank_pos = bits.rank_pos
+        royal = rank_pos[10] | rank_pos[11] | rank_pos[12] | rank_pos[13] | rank_pos[14]
+        suit_pos = [p & royal for p in bits.suit_pos]
+    else:
+        suit_pos = _suit_positions(cards, 10)  # ROYAL_RANKS is 10..14
+    pos = _best_suit(suit_pos)
+    if pos and pos.bit_count() >= n:
+        return _positions(pos)
     return None
 
 
@@ -188,7 +274,25 @@ def is_wheel_ranks(unique_sorted: Sequence[int]) -> bool:
     return list(unique_sorted) == [2, 3, 4, 5, 14]
 
 
-def n_to_straight_unique_ranks(cards: Sequence[Card], n: int) -> Optional[List[int]]:
+# Straight windows as rank masks (bit r = rank r): (window, its two end bits,
+# its ranks) for starts 2..10, plus the wheel (A-2-3-4-5) and its A-2-3-4 draw.
+_STRAIGHT_WINDOWS: Tuple[Tuple[int, int, Tuple[int, ...]], ...] = tuple(
+    (0x1F << start, (1 << start) | (1 << (start + 4)), tuple(range(start, start + 5)))
+    for start in range(2, 11)
+)
+_WHEEL_MASK = (1 << 14) | (0xF << 2)
+_WHEEL_RANKS = (14, 2, 3, 4, 5)
+_WHEEL_DRAW_MASK = (1 << 14) | (0x7 << 2)
+
+
+def _first_index(pos: int) -> int:
+    """Card index of the lowest set bit of a position mask."""
+    return (pos & -pos).bit_length() - 1
+
+
+def n_to_straight_unique_ranks(
+    cards: Sequence[Card], n: int, bits: Optional[HandBits] = None
+) -> Optional[List[int]]:
     """
     VERY simple helper: checks if the hand contains >=n cards that can fit in some 5-rank straight window.
     Returns indices for one such window, else None.
@@ -197,35 +301,30 @@ def n_to_straight_unique_ranks(cards: Sequence[Card], n: int) -> Optional[List[i
     - Ignores suit.
     - Treats A as high (14) and also supports wheel (A2345) via special case.
     - Does not handle all VP 'inside straight' nuances; it's a building block.
+    - Duplicated ranks are represented by their first occurrence.
     """
     if n <= 0:
         return []
 
-    # Map rank -> one index (first occurrence). Duplicates handled by choosing one representative.
-    rank_to_index: Dict[int, int] = {}
-    for i, c in enumerate(cards):
-        rank_to_index.setdefault(c.rank, i)
-
-    uniq = sorted(rank_to_index.keys())
-    if len(uniq) < n:
+    bits = bits or decode(cards)
+    rank_mask, rank_pos = bits.rank_mask, bits.rank_pos
+    if rank_mask.bit_count() < n:
         return None
 
-    # Consider wheel straight explicitly
-    wheel = [14, 2, 3, 4, 5]
-    wheel_present = [r for r in wheel if r in rank_to_index]
-    if len(wheel_present) >= n:
-        return [rank_to_index[r] for r in wheel_present]
+    # Consider wheel straight explicitly (A listed first)
+    wheel = rank_mask & _WHEEL_MASK
+    if wheel.bit_count() >= n:
+        return [_first_index(rank_pos[r]) for r in _WHEEL_RANKS if wheel >> r & 1]
 
-    # Consider all possible 5-rank windows from 2..10 start (10-J-Q-K-A ends at 14)
-    for start in range(2, 11):
-        window = list(range(start, start + 5))
-        present = [r for r in window if r in rank_to_index]
-        if len(present) >= n:
-            return [rank_to_index[r] for r in present]
+    # Each 5-rank window from 2..10 start (10-J-Q-K-A ends at 14) is 5 bits of rank_mask
+    for window, _ends, window_ranks in _STRAIGHT_WINDOWS:
+        present = rank_mask & window
+        if present.bit_count() >= n:
+            return [_first_index(rank_pos[r]) for r in window_ranks if present >> r & 1]
 
     return None
 
-def four_to_outside_straight(cards: Sequence[Card]) -> Optional[List[int]]:
+def four_to_outside_straight(cards: Sequence[Card], bits: Optional[HandBits] = None) -> Optional[List[int]]:
     """
     Return indices of a 4-card open-ended straight draw (outside straight),
     or None if only inside/gutshot or no straight draw exists.
@@ -241,34 +340,21 @@ def four_to_outside_straight(cards: Sequence[Card]) -> Optional[List[int]]:
       5-6-8-9  (inside, needs 7)
       A-3-4-5  (inside, needs 2)
     """
-
-    # Map rank -> index (dedupe ranks; choose first index deterministically)
-    rank_to_index: dict[int, int] = {}
-    for i, c in enumerate(cards):
-        rank_to_index.setdefault(c.rank, i)
-
-    ranks = sorted(rank_to_index.keys())
-    if len(ranks) < 4:
+    bits = bits or decode(cards)
+    rank_mask, rank_pos = bits.rank_mask, bits.rank_pos
+    if rank_mask.bit_count() < 4:
         return None
 
     # --- Wheel special case: A-2-3-4 ---
-    wheel = {14, 2, 3, 4}
-    if wheel.issubset(rank_to_index):
-        return [rank_to_index[r] for r in sorted(wheel)]
-
-    # --- General case: sliding 5-rank windows ---
-    # Valid straight windows start at 2..10
-    for start in range(2, 11):
-        window = set(range(start, start + 5))
-        present = window & set(ranks)
-
-        if len(present) == 4:
-            missing = window - present
-            missing_rank = next(iter(missing))
-
-            # Outside straight: missing rank must be at an end
-            if missing_rank == start or missing_rank == start + 4:
-                return [rank_to_index[r] for r in sorted(present)]
+    if rank_mask & _WHEEL_DRAW_MASK == _WHEEL_DRAW_MASK:
+        return [_first_index(rank_pos[r]) for r in (2, 3, 4, 14)]
+
+    # --- General case: sliding 5-rank windows (start 2..10) ---
+    # Outside straight: 4 of the window's ranks, the missing one at an end
+    for window, ends, window_ranks in _STRAIGHT_WINDOWS:
+        present = rank_mask & window
+        if present.bit_count() == 4 and (window ^ present) & ends:
+            return [_first_index(rank_pos[r]) for r in window_ranks if present >> r & 1]
 
     return None
 
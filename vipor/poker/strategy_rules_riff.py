@@ -1,24 +1,27 @@
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
-from .cards import Card
+import numpy as np
+
+from .cards import INT_TO_CARD, Card
 from .hand_eval import (
-    ROYAL_FLUSH,
-    STRAIGHT_FLUSH,
-    FOUR,
-    FULL_HOUSE,
-    FLUSH,
-    STRAIGHT,
-    THREE,
-    TWO_PAIR,
-    evaluate_hand,
+    CODE_ROYAL_FLUSH,
+    CODE_STRAIGHT_FLUSH,
+    CODE_FOUR,
+    CODE_FULL_HOUSE,
+    CODE_FLUSH,
+    CODE_STRAIGHT,
+    CODE_THREE,
+    CODE_TWO_PAIR,
+    evaluate_hand_category,
 )
-from .strategy import HoldDecision
+from .hand_eval_np import evaluate_codes_np
+from .hold import HOLD_DECISIONS, HoldDecision
 from .strategy_helpers import (
     ROYAL_RANKS,
-    best_pair_indices,
-    job_pair_indices,
+    decode,
     mask_from_indices,
     n_to_flush,
     n_to_royal,
@@ -30,50 +33,81 @@ def _hold_all() -> HoldDecision:
     return HoldDecision(31)
 
 
+_MADE_CODES = frozenset(
+    (CODE_ROYAL_FLUSH, CODE_STRAIGHT_FLUSH, CODE_FOUR, CODE_FULL_HOUSE, CODE_FLUSH, CODE_STRAIGHT, CODE_THREE)
+)
+
+
 def riff_strategy(cards: List[Card]) -> HoldDecision:
-    cat = evaluate_hand(cards).category
+    """
+    riff holds, memoized on the canonical hand.
+
+    riff's holds depend only on which cards are dealt, not their order or
+    the suit names (its suit ties can't reach a 3+ card draw), so the hand
+    is sorted, suits are relabelled by first appearance, and the cached
+    mask over that key is mapped back to the caller's positions.
+    """
+    order = sorted(range(len(cards)), key=lambda i: cards[i].idx)
+    relabel: Dict[int, int] = {}
+    key = tuple(
+        (cards[i].idx & ~3) | relabel.setdefault(cards[i].idx & 3, len(relabel))
+        for i in order
+    )
+    key_mask = _riff_mask(key)
+    mask = 0
+    for j, i in enumerate(order):
+        if key_mask >> j & 1:
+            mask |= 1 << i
+    return HOLD_DECISIONS[mask]
+
+
+@lru_cache(maxsize=1 << 18)
+def _riff_mask(key: Tuple[int, ...]) -> int:
+    return _riff_hold([INT_TO_CARD[c] for c in key]).mask
+
+
+def _riff_hold(cards: List[Card]) -> HoldDecision:
+    code = evaluate_hand_category(cards)
 
     # Made hands: always hold all 5 (for JoB / no kickers)
-    if cat in (ROYAL_FLUSH, STRAIGHT_FLUSH, FOUR, FULL_HOUSE, FLUSH, STRAIGHT, THREE):
+    if code in _MADE_CODES:
         return _hold_all()
 
-    # Draws
-    idx = n_to_royal(cards, 4)
+    # Draws (one decode shared by every helper below)
+    bits = decode(cards)
+    idx = n_to_royal(cards, 4, bits)
     if idx:
         return HoldDecision(mask_from_indices(idx))
 
-    idx = n_to_royal(cards, 3)
+    idx = n_to_royal(cards, 3, bits)
     if idx:
         return HoldDecision(mask_from_indices(idx))
 
-    idx = n_to_flush(cards, 4)
+    idx = n_to_flush(cards, 4, bits)
     if idx:
         return HoldDecision(mask_from_indices(idx))
 
-    # Pairs
-    pairs = pair_ranks(cards)
-    # 2) Prefer low pairs 2–4 (choose the lowest if multiple)
-    if 14 in pairs:  # pair of aces
-        idx = [i for i, c in enumerate(cards) if c.rank == 14]
-        return HoldDecision(mask_from_indices(idx))
+    # Pairs: pair_ranks() lists the ranks held exactly twice, highest first.
+    # Quads of aces or 2s-4s are not in _MADE_CODES, but their four cards
+    # aren't a pair, so they fall through to the royal fallback below.
+    # All picks read the decoded rank positions; nothing rescans the cards.
+    rank_pos = bits.rank_pos
+    pairs = pair_ranks(cards, bits)
+    if pairs:
+        if pairs[0] == 14:  # pair of aces
+            return HOLD_DECISIONS[rank_pos[14]]
 
-    low_35 = [r for r in pairs if 2 <= r <= 4]
-    if low_35:
-        keep_rank = min(low_35)
-        return HoldDecision(mask_from_indices(counts[keep_rank]))
-    
-    idx = job_pair_indices(cards)
-    if idx:
-        return HoldDecision(mask_from_indices(idx))
+        # Prefer low pairs 2–4 (choose the lowest if multiple)
+        if pairs[-1] <= 4:
+            return HOLD_DECISIONS[rank_pos[pairs[-1]]]
 
-    if cat == TWO_PAIR:
-        ranks = set(pair_ranks(cards))
-        idx = [i for i, c in enumerate(cards) if c.rank in ranks]
-        return HoldDecision(mask_from_indices(idx))
+        if pairs[0] >= 11:  # JoB pair (the higher one of two)
+            return HOLD_DECISIONS[rank_pos[pairs[0]]]
 
-    idx = best_pair_indices(cards)
-    if idx:
-        return HoldDecision(mask_from_indices(idx))
+        if code == CODE_TWO_PAIR:
+            return HOLD_DECISIONS[rank_pos[pairs[0]] | rank_pos[pairs[1]]]
+
+        return HOLD_DECISIONS[rank_pos[pairs[0]]]
 
     # Any royal ranks fallback
     idx = [i for i, c in enumerate(cards) if c.rank in ROYAL_RANKS]
@@ -82,3 +116,55 @@ def riff_strategy(cards: List[Card]) -> HoldDecision:
 
     return HoldDecision(0)
 
+
+_POS_BITS = 1 << np.arange(5)
+_MADE_CODES_NP = np.array(sorted(_MADE_CODES))
+# Rank indices (rank - 2) as stored in packed cards (c >> 2)
+_IDX_4 = 2
+_IDX_T = 8
+_IDX_J = 9
+_IDX_A = 12
+
+
+def riff_strategy_batch(init: np.ndarray) -> np.ndarray:
+    """
+    riff_strategy for a batch: (N, 5) packed-int hands -> (N,) hold masks.
+
+    Every rule becomes a per-card (N, 5) bool "would hold" plane plus a
+    per-hand flag; np.select takes the first rule that fires, in
+    riff_strategy's order. Suit ties can't matter: the draws need 3+
+    royals or 4+ of a suit.
+    """
+    # Signed planes: the sim deals uint8 cards, where the -1 sentinel below would wrap to 255
+    ranks = (init >> 2).astype(np.int8)
+    suits = (init & 3).astype(np.int8)
+    rank_count = (ranks[:, :, None] == ranks[:, None, :]).sum(axis=2)
+    same_suit = suits[:, :, None] == suits[:, None, :]
+    suit_count = same_suit.sum(axis=2)
+
+    royal = ranks >= _IDX_T
+    royal_draw = royal & ((same_suit & royal[:, None, :]).sum(axis=2) >= 3)
+    flush_draw = suit_count >= 4
+
+    paired = rank_count == 2
+    pair_ranks = np.where(paired, ranks, -1)
+    aces = paired & (ranks == _IDX_A)
+    low = paired & (ranks <= _IDX_4)
+    low_pair = low & (ranks == np.where(low, ranks, _IDX_A + 1).min(axis=1, keepdims=True))
+    high_pair = paired & (ranks == pair_ranks.max(axis=1, keepdims=True))
+    job_pair = high_pair & (ranks >= _IDX_J)
+
+    code = evaluate_codes_np(init)
+    rules = [
+        (np.isin(code, _MADE_CODES_NP)[:, None], np.ones_like(royal)),
+        (royal_draw.any(axis=1, keepdims=True), royal_draw),
+        (flush_draw.any(axis=1, keepdims=True), flush_draw),
+        (aces.any(axis=1, keepdims=True), aces),
+        (low_pair.any(axis=1, keepdims=True), low_pair),
+        (job_pair.any(axis=1, keepdims=True), job_pair),
+        ((code == CODE_TWO_PAIR)[:, None], paired),
+        (high_pair.any(axis=1, keepdims=True), high_pair),
+    ]
+    held = np.select([cond for cond, _ in rules], [hold for _, hold in rules], royal)
+    return held @ _POS_BITS
+
@@ -0,0 +1,111 @@
+"""
+Inline xorshift64 helpers for the pure-Python MC loops.
+
+State is a plain int threaded through the caller, so a draw costs a few int
+ops instead of a random.Random method dispatch per card.
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+M64 = 0xFFFFFFFFFFFFFFFF
+
+
+def seed_state(seed: int) -> int:
+    """splitmix64-scramble `seed` into a well-mixed, non-zero xorshift64 state."""
+    z = (seed + 0x9E3779B97F4A7C15) & M64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & M64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & M64
+    z ^= z >> 31
+    return z or 1
+
+
+# One straight-line drawer per k (cards to draw), so the trial loop can bind
+# DRAW_FNS[k] once per mask instead of branching on k every trial. Each
+# takes (state, remaining) and returns (new_state, drawn_cards).
+
+def _draw0(state: int, remaining: Sequence[int]) -> tuple[int, tuple[int, ...]]:
+    return state, ()
+
+
+def _draw1(state: int, remaining: Sequence[int]) -> tuple[int, tuple[int, ...]]:
+    state ^= (state << 13) & M64
+    state ^= state >> 7
+    state ^= (state << 17) & M64
+    return state, (remaining[state % len(remaining)],)
+
+
+def _draw2(state: int, remaining: Sequence[int]) -> tuple[int, tuple[int, ...]]:
+    state ^= (state << 13) & M64
+    state ^= state >> 7
+    state ^= (state << 17) & M64
+    n = len(remaining)
+    i = (state & 0x1FFFFF) % n
+    j = ((state >> 21) & 0x1FFFFF) % (n - 1)
+    if j >= i:
+        j += 1
+    return state, (remaining[i], remaining[j])
+
+
+def _draw3(state: int, remaining: Sequence[int]) -> tuple[int, tuple[int, ...]]:
+    state ^= (state << 13) & M64
+    state ^= state >> 7
+    state ^= (state << 17) & M64
+    n = len(remaining)
+    i = (state & 0x1FFFFF) % n
+    j = ((state >> 21) & 0x1FFFFF) % (n - 1)
+    if j >= i:
+        j += 1
+    m = (state >> 42) % (n - 2)
+    lo, hi = (i, j) if i < j else (j, i)
+    if m >= lo:
+        m += 1
+    if m >= hi:
+        m += 1
+    return state, (remaining[i], remaining[j], remaining[m])
+
+
+def _draw_rejection(state: int, remaining: Sequence[int], k: int) -> tuple[int, tuple[int, ...]]:
+    # k 4-5 (holding 1 or 0 cards): two lanes as in _draw2, then extend by
+    # rejection on fresh steps
+    state ^= (state << 13) & M64
+    state ^= state >> 7
+    state ^= (state << 17) & M64
+    n = len(remaining)
+    i = (state & 0x1FFFFF) % n
+    j = ((state >> 21) & 0x1FFFFF) % (n - 1)
+    if j >= i:
+        j += 1
+    picked = [i, j]
+    while len(picked) < k:
+        state ^= (state << 13) & M64
+        state ^= state >> 7
+        state ^= (state << 17) & M64
+        m = state % n
+        if m not in picked:
+            picked.append(m)
+    return state, tuple(remaining[m] for m in picked)
+
+
+def _draw4(state: int, remaining: Sequence[int]) -> tuple[int, tuple[int, ...]]:
+    return _draw_rejection(state, remaining, 4)
+
+
+def _draw5(state: int, remaining: Sequence[int]) -> tuple[int, tuple[int, ...]]:
+    return _draw_rejection(state, remaining, 5)
+
+
+DRAW_FNS = (_draw0, _draw1, _draw2, _draw3, _draw4, _draw5)
+
+
+def xor_draw_k(state: int, remaining: Sequence[int], k: int) -> tuple[int, tuple[int, ...]]:
+    """
+    Draw k distinct cards from `remaining`; returns (new_state, drawn_cards).
+
+    For k <= 3 one xorshift step feeds all indices (21-bit lanes) and
+    distinctness comes from index shifting, so there is no rejection loop.
+    Hot loops should bind DRAW_FNS[k] directly.
+    """
+    if k <= 0:
+        return state, ()
+    return DRAW_FNS[k](state, remaining)